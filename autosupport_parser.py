@@ -9,15 +9,657 @@ key system information for analysis and reporting.
 """
 
 import argparse
+import contextlib
 import csv
-import email
+import hashlib
+import io
+import json
+import mmap
 import os
+import posixpath
 import re
+import sys
 import tarfile
 import time
-import tempfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from email.parser import BytesParser
+from email.policy import compat32
+from functools import lru_cache, partial
+from html import escape
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Any
+
+
+# Precompiled regex patterns (compiled once at import instead of on every call).
+# Whole-file patterns are bytes patterns so they can run directly on the
+# memory-mapped autosupport file; only the matched sections get decoded.
+
+# Service status checks. Literals are plain substring probes; the remaining
+# patterns are lowercase and run against a lowercased copy of the content,
+# which is equivalent to IGNORECASE without its per-character case folding
+_NFS_ACTIVE_HINT = b'the nfs system is currently active and running'
+_NFS_DISABLED_RE = re.compile(rb'nfs.*disabled|nfs.*not.*running')
+_CIFS_DISABLED_HINT = b'cifs is disabled'
+_CIFS_ENABLED_RE = re.compile(rb'cifs.*enabled|cifs.*active')
+_NDMP_DISABLED_HINT = b'ndmp daemon admin_state: disabled'
+_NDMP_ENABLED_HINT = b'ndmp daemon admin_state: enabled'
+_CLOUD_TIER_SECTION_RE = re.compile(rb'CLOUD TIER.*:')
+_CLOUD_UNIT_HINT = b'Cloud Unit:'
+_CLOUD_DISABLED_RE = re.compile(rb'cloud.*disabled')
+_REPL_ENABLED_RE = re.compile(rb'enabled:\s+yes')
+_REPL_DISABLED_RE = re.compile(rb'enabled:\s+no|replication.*disabled')
+_REPL_STATUS_HINT = b'Replication Status'
+
+# Mtree retention lock and replication context sections
+_MTREE_RETENTION_RE = re.compile(
+    rb'Mtree: (/data/col1/[^\s]+)\s*\n\s*Option\s+Value\s*\n-+\s+-+\s*\n(.*?)\n-+\s+-+(?=\s*\n|$)',
+    re.DOTALL | re.MULTILINE
+)
+_REPL_CONTEXT_RE = re.compile(rb'CTX:\s+\d+\s*\n(.*?)(?=CTX:\s+\d+|Replication Options|$)', re.DOTALL)
+
+# Retention lock option names mapped to their output fields
+_RETENTION_OPTION_FIELDS = {
+    'Retention-lock': 'Retention_Lock',
+    'Retention-lock mode': 'Lock_Mode',
+    'Retention-lock min-retention-period': 'Min_Retention_Period',
+    'Retention-lock max-retention-period': 'Max_Retention_Period'
+}
+
+# Cloud tier sections
+_CLOUD_PROFILES_RE = re.compile(
+    rb'Cloud Profiles\s*\n-{10,}\s*\n(.*?)(?=\nCloud Unit List|\nCloud Data-Movement|$)', re.DOTALL
+)
+_PROFILE_SPLIT_RE = re.compile(r'(?=Profile name:)')
+# Cloud profile fields, each read from its own "Label: value" line ([^\S\n] is
+# whitespace other than a newline, so a blank value never runs onto the next line)
+_CLOUD_PROFILE_FIELDS = [
+    (field, re.compile(r'^[^\S\n]*%s:[^\S\n]*(.*?)[^\S\n]*$' % label, re.MULTILINE))
+    for field, label in [
+        ('Profile_Name', 'Profile name'),
+        ('Provider', 'Provider'),
+        ('Endpoint', 'Endpoint'),
+        ('Version', 'Version'),
+        ('Proxy_Host', 'Proxy host'),
+        ('Proxy_Port', 'Proxy port'),
+        ('Proxy_Username', 'Proxy username')
+    ]
+]
+_CLOUD_MOVEMENT_RE = re.compile(
+    rb'Cloud Data-Movement Configuration\s*\n-{30,}(.*?)(?=\nData-movement is scheduled)', re.DOTALL
+)
+# Data-movement row: mtree, target, policy, then the value. Columns after the
+# mtree path are separated by runs of 2+ spaces, so unit names, policies and
+# values may contain single spaces (e.g. "Cloud/DFW ECS Archive", "21 days")
+_CLOUD_MOVEMENT_ROW_RE = re.compile(r'(/data/col1/\S+)\s+(\S.*?)\s{2,}(\S.*?)\s{2,}(\S.*)')
+
+# Storage usage tables
+_STORAGE_USAGE_PATTERNS = {
+    'Active Tier Usage': re.compile(rb'Active Tier:\s*\nResource.*?\n(.*?)(?=\n\s*\* |\n\s*Cloud Tier|\Z)', re.DOTALL | re.MULTILINE),
+    'Cloud Tier Usage': re.compile(rb'Cloud Tier\s*\nResource.*?\n(.*?)(?=\n\s*\* |\n\s*Total:|\Z)', re.DOTALL | re.MULTILINE),
+    'Total Usage': re.compile(rb'Total:\s*\nResource.*?\n(.*?)(?=\n\s*\* |\Z)', re.DOTALL | re.MULTILINE)
+}
+
+# Compression statistics tables
+_COMPRESSION_PATTERNS = {
+    'Active Tier Compression': re.compile(rb'Active Tier:\s*\n\s*Pre-Comp.*?Total-Comp.*?\n.*?\n(.*?)(?=\n\s*\*.*?cleaning|\n\s*Cloud Tier:)', re.DOTALL | re.MULTILINE),
+    'Cloud Tier Compression': re.compile(rb'(?s)Filesys Compression.*?Cloud Tier:\s*\n.*?-{10,}\s*\n(.*?)(?=\n\s*\* Does not include)', re.DOTALL | re.MULTILINE),
+    'Currently Used Summary': re.compile(rb'Currently Used:\*\s*\n\s*Pre-Comp.*?Total-Comp.*?\n.*?\n(.*?)(?=\n\s*Key:)', re.DOTALL | re.MULTILINE)
+}
+
+# Mtree Show Compression and Mtree List tables (optimized to avoid catastrophic backtracking)
+_MTREE_PATTERNS = {
+    'Mtree Active Tier Compression': re.compile(rb'Mtree Show Compression[^\n]*\n(?:[^\n]*\n)*?Active Tier:[^\n]*\n(?:-{10,}[^\n]*\n)([^-]*?)(?:-{10,}|Cloud Tier:)', re.DOTALL | re.MULTILINE),
+    'Mtree Cloud Tier Compression': re.compile(rb'Mtree Show Compression[^\n]*\n(?:[^\n]*\n)*?Cloud Tier:[^\n]*\n(?:-{10,}[^\n]*\n)([^-]*?)(?:-{10,}|Key:)', re.DOTALL | re.MULTILINE),
+    'Mtree List': re.compile(rb'Mtree List\s*\n-{5,}\s*\nName[^\n]*Pre-Comp[^\n]*Status[^\n]*\n-{10,}[^\n]*\n((?:/data/col1/[^\n]*\n)*?)(?=-{10,}|\nMtree Options|\Z)', re.DOTALL | re.MULTILINE)
+}
+
+# Literals that must appear, in this order, for a table pattern to match; the
+# first is the section header the pattern starts with and a tuple means any
+# one of its literals. Checked with plain find() before running the pattern,
+# whose lazy wildcards otherwise backtrack over the rest of the file (once per
+# header occurrence) whenever the table is missing or truncated
+_TABLE_PREREQUISITES = {
+    'Active Tier Usage': (b'Active Tier:', b'Resource'),
+    'Cloud Tier Usage': (b'Cloud Tier', b'Resource'),
+    'Total Usage': (b'Total:', b'Resource'),
+    'Active Tier Compression': (b'Active Tier:', b'Pre-Comp', b'Total-Comp', (b'cleaning', b'Cloud Tier:')),
+    'Cloud Tier Compression': (b'Filesys Compression', b'Cloud Tier:', b'-' * 10, b'* Does not include'),
+    'Currently Used Summary': (b'Currently Used:*', b'Pre-Comp', b'Total-Comp', b'Key:'),
+    'Mtree Active Tier Compression': (b'Mtree Show Compression', b'Active Tier:', b'-' * 10, (b'-' * 10, b'Cloud Tier:')),
+    'Mtree Cloud Tier Compression': (b'Mtree Show Compression', b'Cloud Tier:', b'-' * 10, (b'-' * 10, b'Key:')),
+    'Mtree List': (b'Mtree List', b'-' * 5, b'Name', b'Pre-Comp', b'Status')
+}
+
+# Column separator for tables whose cells may contain single spaces
+_MULTI_SPACE_RE = re.compile(r'\s{2,}')
+
+# Column header words that mark a table header line, matched anywhere in the line
+_TABLE_HEADER_RE = re.compile('Resource|Size GiB|Pre-Comp|Post-Comp')
+
+# Metric labels that mark a compression row, matched anywhere in the line
+_COMP_LABEL_RE = re.compile('|'.join(map(re.escape, (
+    'Currently Used', 'Last 7 days', 'Last 24 hrs', 'Active Tier', 'Cloud Tier', 'Total', 'Written'
+))))
+
+# Row keys, in column order, for the parsed storage tables
+_USAGE_COLUMNS = ('Resource', 'Size_GiB', 'Used_GiB', 'Avail_GiB', 'Use_Percent', 'Cleanable_GiB')
+_COMPRESSION_COLUMNS = ('Metric', 'Pre_Comp_GiB', 'Post_Comp_GiB', 'Global_Comp_Factor',
+                        'Local_Comp_Factor', 'Total_Comp_Factor')
+_MTREE_COMPRESSION_COLUMNS = ('Mtree', 'Pre_24hrs_GiB', 'Post_24hrs_GiB', 'Global_24hrs', 'Local_24hrs',
+                              'Total_24hrs', 'Reduction_24hrs_Percent', 'Pre_7days_GiB', 'Post_7days_GiB',
+                              'Global_7days', 'Local_7days', 'Total_7days', 'Reduction_7days_Percent')
+_MTREE_LIST_COLUMNS = ('Name', 'Pre_Comp_GiB', 'Status', 'Retention_Lock', 'Lock_Mode', 'Min_Retention_Period',
+                       'Max_Retention_Period', 'Replication_Mode', 'Replication_Host', 'Replication_Enabled')
+_CLOUD_PROFILE_COLUMNS = ('Profile_Name', 'Provider', 'Endpoint', 'Version', 'Proxy_Host', 'Proxy_Port', 'Proxy_Username')
+_CLOUD_MOVEMENT_COLUMNS = ('Mtree', 'Target', 'Policy', 'Value')
+
+# Storage tables in report order, grouped by report section
+_USAGE_TABLES = ('Active Tier Usage', 'Cloud Tier Usage', 'Total Usage')
+_COMPRESSION_TABLES = ('Active Tier Compression', 'Cloud Tier Compression', 'Currently Used Summary')
+_MTREE_TABLES = ('Mtree List', 'Mtree Active Tier Compression', 'Mtree Cloud Tier Compression')
+
+# CSV header rows for the tables above
+_CSV_USAGE_HEADERS = ('Resource', 'Size GiB', 'Used GiB', 'Avail GiB', 'Use%', 'Cleanable GiB')
+_CSV_COMPRESSION_HEADERS = ('Metric', 'Pre-Comp GiB', 'Post-Comp GiB', 'Global-Comp Factor', 'Local-Comp Factor',
+                            'Total-Comp Factor')
+_CSV_MTREE_LIST_HEADERS = ('Name', 'Pre-Comp GiB', 'Status', 'Retention Lock', 'Lock Mode', 'Min Retention Period',
+                           'Max Retention Period', 'Replication Mode', 'Replication Host', 'Replication Enabled')
+_CSV_MTREE_COMPRESSION_HEADERS = ('Mtree', 'Pre-24hrs GiB', 'Post-24hrs GiB', 'Global-24hrs', 'Local-24hrs',
+                                  'Total-24hrs', 'Reduction-24hrs %', 'Pre-7days GiB', 'Post-7days GiB',
+                                  'Global-7days', 'Local-7days', 'Total-7days', 'Reduction-7days %')
+_CSV_CLOUD_PROFILE_HEADERS = ('Profile Name', 'Provider', 'Endpoint', 'Version', 'Proxy Host', 'Proxy Port',
+                              'Proxy Username')
+_CSV_CLOUD_MOVEMENT_HEADERS = ('Mtree', 'Target', 'Policy', 'Value')
+
+# Pre-rendered CSV rows for the blank spacer and entry separator lines, written
+# straight to the buffer (csv.writer's default '\r\n' line terminator)
+_CSV_BLANK_ROW = ',\r\n'
+_CSV_SEPARATOR_ROW = '---,---\r\n'
+
+# Console table row templates, built once; each header is its row template
+# filled with the column titles
+_CONSOLE_USAGE_ROW = "  " + "  ".join(["{:>15}"] * len(_USAGE_COLUMNS))
+_CONSOLE_USAGE_HEADER = _CONSOLE_USAGE_ROW.format(
+    'Resource', 'Size GiB', 'Used GiB', 'Avail GiB', 'Use%', 'Cleanable GiB')
+_CONSOLE_COMPRESSION_ROW = "  " + "  ".join(["{:>15}"] * len(_COMPRESSION_COLUMNS))
+_CONSOLE_COMPRESSION_HEADER = _CONSOLE_COMPRESSION_ROW.format(
+    'Metric', 'Pre-Comp GiB', 'Post-Comp GiB', 'Global-Comp', 'Local-Comp', 'Total-Comp')
+_CONSOLE_MTREE_LIST_ROW = "  {:<30} {:>12} {:<18} {:<9} {:<10} {:<10} {:<10} {:<11} {:<12} {:<7}"
+_CONSOLE_MTREE_LIST_HEADER = _CONSOLE_MTREE_LIST_ROW.format(
+    'Mtree Name', 'Pre-Comp GiB', 'Status', 'Ret Lock', 'Lock Mode', 'Min Period', 'Max Period',
+    'Repl Mode', 'Repl Host', 'Enabled')
+_CONSOLE_MTREE_COMPRESSION_ROW = "  " + "  ".join(["{:>12}"] * len(_MTREE_COMPRESSION_COLUMNS))
+_CONSOLE_MTREE_COMPRESSION_HEADER = _CONSOLE_MTREE_COMPRESSION_ROW.format(
+    'Mtree', 'Pre-24h GiB', 'Post-24h GiB', 'Glob-24h', 'Loc-24h', 'Tot-24h', 'Red-24h%',
+    'Pre-7d GiB', 'Post-7d GiB', 'Glob-7d', 'Loc-7d', 'Tot-7d', 'Red-7d%')
+_CONSOLE_CLOUD_PROFILES_ROW = "  {:<30} {:<10} {:<35} {:<15} {:<15} {:<6} {:<10}"
+_CONSOLE_CLOUD_PROFILES_HEADER = _CONSOLE_CLOUD_PROFILES_ROW.format(
+    'Profile Name', 'Provider', 'Endpoint', 'Version', 'Proxy Host', 'Port', 'Username')
+_CONSOLE_CLOUD_MOVEMENT_ROW = "  {:<30} {:<26} {:<15} {:<15}"
+_CONSOLE_CLOUD_MOVEMENT_HEADER = _CONSOLE_CLOUD_MOVEMENT_ROW.format('Mtree', 'Target', 'Policy', 'Value')
+
+# HTML table rows: a label cell followed by value cells, filled with % formatting
+_HTML_FIELD_ROW = '<tr><td class="label">%s</td><td class="value">%s</td></tr>'
+_HTML_USAGE_ROW = '<tr><td class="label">%s</td>' + '<td class="value">%s</td>' * (len(_USAGE_COLUMNS) - 1) + '</tr>'
+_HTML_COMPRESSION_ROW = (
+    '<tr><td class="label">%s</td>' + '<td class="value">%s</td>' * (len(_COMPRESSION_COLUMNS) - 1) + '</tr>')
+_HTML_MTREE_LIST_ROW = (
+    '<tr><td class="label">%s</td>' + '<td class="value">%s</td>' * (len(_MTREE_LIST_COLUMNS) - 1) + '</tr>')
+_HTML_MTREE_COMPRESSION_ROW = (
+    '<tr><td class="label">%s</td>' + '<td class="value">%s</td>' * (len(_MTREE_COMPRESSION_COLUMNS) - 1) + '</tr>')
+_HTML_CLOUD_PROFILE_ROW = (
+    '<tr><td class="label">%s</td>' + '<td class="value">%s</td>' * (len(_CLOUD_PROFILE_COLUMNS) - 1) + '</tr>')
+_HTML_CLOUD_MOVEMENT_ROW = (
+    '<tr><td class="label">%s</td>' + '<td class="value">%s</td>' * (len(_CLOUD_MOVEMENT_COLUMNS) - 1) + '</tr>')
+
+# HTML table header rows
+_HTML_USAGE_HEADER = ('<tr><th>Resource</th><th>Size GiB</th><th>Used GiB</th><th>Avail GiB</th><th>Use%</th>'
+                      '<th>Cleanable GiB</th></tr>')
+_HTML_COMPRESSION_HEADER = ('<tr><th>Metric</th><th>Pre-Comp GiB</th><th>Post-Comp GiB</th><th>Global-Comp Factor</th>'
+                            '<th>Local-Comp Factor</th><th>Total-Comp Factor</th></tr>')
+_HTML_MTREE_LIST_HEADER = ('<tr><th>Name</th><th>Pre-Comp GiB</th><th>Status</th><th>Ret Lock</th><th>Lock Mode</th>'
+                           '<th>Min Period</th><th>Max Period</th><th>Repl Mode</th><th>Repl Host</th>'
+                           '<th>Enabled</th></tr>')
+_HTML_MTREE_COMPRESSION_HEADER = ('<tr><th>Mtree</th><th>Pre-24hrs GiB</th><th>Post-24hrs GiB</th><th>Global-24hrs</th>'
+                                  '<th>Local-24hrs</th><th>Total-24hrs</th><th>Red-24hrs %</th><th>Pre-7days GiB</th>'
+                                  '<th>Post-7days GiB</th><th>Global-7days</th><th>Local-7days</th><th>Total-7days</th>'
+                                  '<th>Red-7days %</th></tr>')
+_HTML_CLOUD_PROFILE_HEADER = ('<tr><th>Profile Name</th><th>Provider</th><th>Endpoint</th><th>Version</th>'
+                              '<th>Proxy Host</th><th>Proxy Port</th><th>Proxy Username</th></tr>')
+_HTML_CLOUD_MOVEMENT_HEADER = '<tr><th>Mtree</th><th>Target</th><th>Policy</th><th>Value</th></tr>'
+
+# Fixed HTML report sections with a hole for their dynamic table rows
+_HTML_SYSTEM_INFO_TABLE = '<h3>System Information</h3><table>%s</table>'
+_HTML_SERVICES_TABLE = '<h3>Services Status</h3><table>%s</table>'
+_HTML_CLOUD_PROFILES_TABLE = '<h3>Cloud Profiles</h3><table>' + _HTML_CLOUD_PROFILE_HEADER + '%s</table>'
+_HTML_CLOUD_MOVEMENT_TABLE = ('<h3>Cloud Data-Movement Configuration</h3><table>' + _HTML_CLOUD_MOVEMENT_HEADER +
+                              '%s</table>')
+_HTML_SOURCE_TABLE = ('<h3>Source Information</h3><table>' + _HTML_FIELD_ROW % ('SOURCE_FILE', '%s') +
+                      _HTML_FIELD_ROW % ('SOURCE_TAR', '%s') + '</table>')
+
+# HTML report stylesheet, kept as plain CSS and inserted into the page head as-is
+_HTML_STYLE = """    <style>
+        /* Cohesity official green palette */
+        :root {
+            --brand-green: #00DD68; /* official Cohesity green */
+            --brand-green-dark: #00b355;
+            --surface: #ffffff;
+            --muted: #e6eef0;
+            --text: #0f172a;
+            --subtle: #475569;
+        }
+        body {
+            font-family: 'Inter', 'Roboto', 'Helvetica Neue', Arial, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background: linear-gradient(135deg, #f7faf8 0%, #eef6f1 100%);
+            color: var(--text);
+            line-height: 1.6;
+        }
+        .container {
+            max-width: 1400px;
+            margin: 0 auto;
+            background-color: var(--surface);
+            padding: 40px;
+            border-radius: 12px;
+            box-shadow: 0 4px 25px rgba(0,0,0,0.06);
+            border: 1px solid var(--muted);
+        }
+        h1 {
+            color: var(--text);
+            text-align: center;
+            font-size: 2.25rem;
+            font-weight: 700;
+            margin-bottom: 40px;
+            position: relative;
+            padding-bottom: 20px;
+        }
+        /* make the first letter of the host name the green accent to mimic the brand mark */
+        h1 .host::first-letter {
+            color: var(--brand-green);
+            font-weight: 800;
+        }
+        h1::after {
+            content: '';
+            position: absolute;
+            bottom: 0;
+            left: 50%;
+            transform: translateX(-50%);
+            width: 80px;
+            height: 4px;
+            background: linear-gradient(90deg, var(--brand-green) 0%, var(--brand-green-dark) 100%);
+            border-radius: 2px;
+        }
+        h2 {
+            color: var(--text);
+            font-size: 1.5rem;
+            font-weight: 600;
+            margin-top: 40px;
+            margin-bottom: 20px;
+            padding: 12px 20px;
+            background: linear-gradient(90deg, #f6fbf8 0%, #eef6f1 100%);
+            border-left: 5px solid var(--brand-green);
+            border-radius: 0 8px 8px 0;
+        }
+        h3 {
+            color: #334155;
+            font-size: 1.25rem;
+            font-weight: 600;
+            margin-top: 30px;
+            margin-bottom: 15px;
+            padding-bottom: 8px;
+            border-bottom: 2px solid #eef6f1;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-bottom: 25px;
+            background-color: var(--surface);
+            border-radius: 8px;
+            overflow: hidden;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.04);
+            border: 1px solid var(--muted);
+        }
+        th {
+            background: var(--brand-green);
+            color: #ffffff;
+            padding: 16px 12px;
+            text-align: center;
+            font-weight: 600;
+            font-size: 0.875rem;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            border: none;
+        }
+        td.label {
+            background-color: #fbfdfb;
+            font-weight: 600;
+            text-align: left;
+            padding: 14px 16px;
+            border: 1px solid var(--muted);
+            color: var(--subtle);
+            width: 220px;
+        }
+        td.value {
+            text-align: right;
+            padding: 14px 16px;
+            border: 1px solid var(--muted);
+            color: var(--text);
+            font-weight: 500;
+        }
+        tr:nth-child(even) {
+            background-color: #f6fbf8;
+        }
+        tr:hover {
+            background-color: #e8f9ee;
+            transform: translateY(-1px);
+            transition: all 0.2s ease;
+        }
+        .entry-separator {
+            margin: 50px 0;
+            border-top: 3px solid var(--brand-green);
+            padding-top: 30px;
+            position: relative;
+        }
+        .entry-separator::before {
+            content: '';
+            position: absolute;
+            top: -2px;
+            left: 0;
+            right: 0;
+            height: 1px;
+            background: linear-gradient(90deg, transparent 0%, var(--brand-green) 50%, transparent 100%);
+        }
+        .note {
+            background: linear-gradient(135deg, #f0fff4 0%, #dcffe8 100%);
+            border: 1px solid #7dd48b;
+            border-radius: 8px;
+            padding: 16px 20px;
+            margin: 20px 0;
+            font-style: italic;
+            color: #04512b;
+            position: relative;
+            box-shadow: 0 2px 8px rgba(34,197,94,0.06);
+        }
+        .note::before {
+            content: '💡';
+            position: absolute;
+            left: -8px;
+            top: 50%;
+            transform: translateY(-50%);
+            background: var(--brand-green);
+            width: 24px;
+            height: 24px;
+            border-radius: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-size: 12px;
+        }
+        .section-header {
+            background: linear-gradient(135deg, #0f172a 0%, #071017 100%);
+            color: #ffffff;
+            text-align: center;
+            padding: 16px;
+            font-weight: 700;
+            font-size: 1.1rem;
+            letter-spacing: 1px;
+            text-transform: uppercase;
+            margin-top: 20px;
+        }
+    </style>"""
+
+# HTML report page up to the first entry (filled with hostname_prefix and the
+# stylesheet), and its closing tags
+_HTML_HEAD_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{hostname_prefix} - Data Domain Autosupport Report</title>
+{style}
+</head>
+<body>
+    <div class="container">
+        <h1><span class="host">{hostname_prefix}</span> <span class="separator">—</span> <span class="title-text">Data Domain Autosupport Report</span></h1>
+"""
+_HTML_TAIL = """
+    </div>
+</body>
+</html>"""
+
+# Bump when parsing changes so cached results from older versions are not reused
+_CACHE_VERSION = 1
+
+# Slice size used when lowercasing a memory-mapped autosupport file
+_LOWERCASE_CHUNK_SIZE = 1 << 20
+
+# Location of the autosupport file inside a support bundle
+_AUTOSUPPORT_MEMBER = 'ddr/var/support/autosupport'
+
+# GENERATED_ON timestamps, with optional weekday and timezone tokens
+# Examples: "Fri Dec  6 06:16:27 EST 2024", "Dec  6 06:16:27 2024"
+_GENERATED_ON_RE = re.compile(
+    r'(?:[a-z]+\s+)?([a-z]+)\s+(\d{1,2})\s+\d{1,2}:\d{1,2}:\d{1,2}\s+(?:[a-z]+\s+)?(\d{4})', re.IGNORECASE
+)
+_MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December']
+_MONTHS = {key: number for number, name in enumerate(_MONTH_NAMES, 1) for key in (name.lower(), name[:3].lower())}
+
+# Helpers for dates and folder names
+_DIGITS_RE = re.compile(r'\d+')
+# Characters unsafe in folder names, or a run of whitespace (both become '_')
+_UNSAFE_FOLDER_RE = re.compile(r'[<>:"/\\|?*]|\s+')
+
+
+def _decode(raw: bytes) -> str:
+    """Decode a matched section of an autosupport file, ignoring bad bytes"""
+    return raw.decode('utf-8', errors='ignore')
+
+
+def _lowercase(content: bytes) -> bytes:
+    """
+    Lowercase autosupport content without first copying a memory-mapped file
+    
+    Args:
+        content: Raw autosupport content (bytes or memory-mapped file)
+        
+    Returns:
+        Lowercased content (bytes, or a bytearray for a memory-mapped file)
+    """
+    if isinstance(content, bytes):
+        return content.lower()
+    
+    # mmap has no lower(); lowercase it a chunk at a time into one buffer so the
+    # only full-size copy made is the result
+    size = len(content)
+    low = bytearray(size)
+    for pos in range(0, size, _LOWERCASE_CHUNK_SIZE):
+        end = pos + _LOWERCASE_CHUNK_SIZE
+        low[pos:end] = content[pos:end].lower()
+    return low
+
+
+def _search_table(pattern: re.Pattern, content: bytes, prerequisites: Tuple, start: int) -> Optional[re.Match]:
+    """
+    Search for a table pattern starting from its section header
+    
+    Args:
+        pattern: Compiled table pattern that begins with the section header
+        content: Raw autosupport content (bytes or memory-mapped file)
+        prerequisites: Header followed by the literals the table needs, in order
+        start: Offset of the first occurrence of the header (-1 if absent)
+        
+    Returns:
+        Match object, or None if the table cannot be present
+    """
+    if start == -1:
+        return None
+    
+    # Walk the earliest occurrence of each required literal; if any is missing
+    # the pattern cannot match, so skip it rather than let it backtrack
+    pos = start + len(prerequisites[0])
+    for needed in prerequisites[1:]:
+        ends = []
+        for literal in (needed if isinstance(needed, tuple) else (needed,)):
+            found = content.find(literal, pos)
+            if found != -1:
+                ends.append(found + len(literal))
+        if not ends:
+            return None
+        pos = min(ends)
+    
+    # No match can begin before the first header, so this is equivalent to
+    # searching the whole file
+    return pattern.search(content, start)
+
+
+def _split_total_reduction(value: str) -> Tuple[str, str]:
+    """
+    Split a Total(Reduction%) value such as "3.1x(67.8%)"
+    
+    Args:
+        value: Total compression column value
+        
+    Returns:
+        Tuple of (total, reduction), with 'N/A' as the reduction if absent
+    """
+    if '(' not in value or ')' not in value:
+        return value, 'N/A'
+    total, _, rest = value.partition('(')
+    return total, rest.partition('(')[0].rstrip(')')
+
+
+def _parse_mtree_compression_row(line: str) -> Optional[Dict[str, str]]:
+    """
+    Parse one data row of an mtree compression table
+    
+    Args:
+        line: Stripped table line starting with /data/col1/
+        
+    Returns:
+        Row dictionary keyed by _MTREE_COMPRESSION_COLUMNS, or None if the
+        line does not hold a full row
+    """
+    clean_line = line.replace('*', '').strip()
+    if len(clean_line) <= 35:
+        return None
+    
+    # Tokenize the whole row in one split: the mtree path, then
+    # 10 values (5 for 24hrs, 5 for 7days)
+    tokens = clean_line.split()
+    if len(tokens) < 11 or len(tokens[0]) <= len('/data/col1/'):
+        return None
+    
+    values = ['N/A' if value == '-' else value for value in tokens[1:11]]
+    
+    # The Total columns expand into Total and Reduction%
+    cells = [tokens[0], *values[:4], *_split_total_reduction(values[4]),
+             *values[5:9], *_split_total_reduction(values[9])]
+    return dict(zip(_MTREE_COMPRESSION_COLUMNS, cells))
+
+
+def _console_cells(row: Dict[str, str], columns: Tuple[str, ...]) -> List[str]:
+    """
+    Collect a storage table row's console cells in a single pass
+    
+    Args:
+        row: Parsed table row
+        columns: Row keys to show, in column order
+        
+    Returns:
+        Cell strings, with missing, empty and '-' values as 'N/A'
+    """
+    return ['N/A' if value in ('-', '') else str(value) for value in map(row.get, columns, repeat('N/A'))]
+
+
+def _csv_table_rows(rows: List[Dict[str, str]], columns: Tuple[str, ...]) -> Iterator[List[str]]:
+    """
+    Yield CSV data rows for a storage table, in column order
+    
+    Args:
+        rows: Parsed table rows
+        columns: Row keys to write, in column order
+        
+    Returns:
+        Iterator of row value lists, with missing and '-' values as 'N/A'
+    """
+    for row in rows:
+        yield ['N/A' if value == '-' else value for value in map(row.get, columns, repeat('N/A'))]
+
+
+def _html_escape_cells(cells: List[Tuple[str, ...]]) -> List[Tuple[str, ...]]:
+    """
+    HTML-escape a table's cell values
+    
+    Parsed values almost never contain markup characters, so the whole table
+    is scanned once and escaping is skipped entirely when it is clean.
+    
+    Args:
+        cells: Cell values for each row
+        
+    Returns:
+        The same cells, HTML-escaped where needed
+    """
+    text = '\0'.join(map('\0'.join, cells))
+    if '&' in text or '<' in text or '>' in text or '"' in text or "'" in text:
+        return [tuple(map(escape, row_cells)) for row_cells in cells]
+    return cells
+
+
+def _html_table_rows(rows: List[Dict[str, str]], row_template: str, columns: Tuple[str, ...]) -> str:
+    """
+    Render a table's HTML rows as one string
+    
+    Args:
+        rows: Parsed table rows
+        row_template: %-template with one placeholder per column
+        columns: Row keys to show, in column order
+        
+    Returns:
+        Concatenated <tr> elements, with missing values as 'N/A' and cell text HTML-escaped
+    """
+    cells = _html_escape_cells([tuple(map(row.get, columns, repeat('N/A'))) for row in rows])
+    return ''.join([row_template % row_cells for row_cells in cells])
+
+
+def _html_dash_table_rows(rows: List[Dict[str, str]], row_template: str, columns: Tuple[str, ...]) -> str:
+    """
+    Render a table's HTML rows as one string, showing unavailable values as '-'
+    
+    Args:
+        rows: Parsed table rows
+        row_template: %-template with one placeholder per column
+        columns: Row keys to show, in column order
+        
+    Returns:
+        Concatenated <tr> elements, with missing and 'N/A' cells as '-' and cell
+        text HTML-escaped
+    """
+    # Compare whole cells so values that merely contain 'N/A' (such as an
+    # mtree path) are left intact
+    cells = _html_escape_cells([tuple(['-' if value == 'N/A' else value
+                                       for value in map(row.get, columns, repeat('-'))])
+                                for row in rows])
+    return ''.join([row_template % row_cells for row_cells in cells])
+
+
+# HTML rendering of each storage table, in report order: (table name, heading,
+# table opening with its header row, row renderer, row template, row keys)
+_HTML_STORAGE_TABLES = (
+    *((name, f'<h3>{name.replace(" Usage", "")}</h3>', '<table>' + _HTML_USAGE_HEADER,
+       _html_table_rows, _HTML_USAGE_ROW, _USAGE_COLUMNS) for name in _USAGE_TABLES),
+    *((name, f'<h3>{name.replace(" Compression", " Compression Stats")}</h3>', '<table>' + _HTML_COMPRESSION_HEADER,
+       _html_table_rows, _HTML_COMPRESSION_ROW, _COMPRESSION_COLUMNS) for name in _COMPRESSION_TABLES),
+    ('Mtree List', '<h3>Mtree List</h3>', '<table>' + _HTML_MTREE_LIST_HEADER,
+     _html_table_rows, _HTML_MTREE_LIST_ROW, _MTREE_LIST_COLUMNS),
+    *((name, f'<h3>{name}</h3>', '<table>' + _HTML_MTREE_COMPRESSION_HEADER,
+       _html_dash_table_rows, _HTML_MTREE_COMPRESSION_ROW, _MTREE_COMPRESSION_COLUMNS)
+      for name in _MTREE_TABLES if name != 'Mtree List'),
+)
 
 
 class AutosupportParser:
@@ -33,6 +675,12 @@ class AutosupportParser:
         'LOCATION'
     ]
     
+    # Single KEY=value pattern matching any of the required fields, so they can
+    # all be collected in one pass over the file
+    _FIELDS_RE = re.compile(
+        rb'^(%s)=(.*)$' % b'|'.join(re.escape(field.encode()) for field in REQUIRED_FIELDS), re.MULTILINE
+    )
+    
     # Services to check
     SERVICES = [
         'NFS',
@@ -42,101 +690,97 @@ class AutosupportParser:
         'REPLICATION'
     ]
     
-    def __init__(self):
+    # Defaults for every parsed entry, built once; values are immutable strings
+    # so a shallow copy per file is safe
+    _EMPTY_ENTRY = {**dict.fromkeys(REQUIRED_FIELDS, 'N/A'), **dict.fromkeys(SERVICES, 'Unknown')}
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Directory for cached parse results keyed by content hash
+                (default: no caching)
+        """
         self.parsed_data = []
+        self.cache_dir = cache_dir
     
-    def extract_tar_gz(self, tar_path: str, temp_dir: str) -> List[str]:
+    def extract_tar_gz(self, tar_path: str) -> List[Tuple[str, bytes]]:
         """
-        Extract tar.gz file and find autosupport files
+        Read the autosupport file out of a tar.gz support bundle
         
         Args:
             tar_path: Path to the tar.gz file
-            temp_dir: Temporary directory for extraction
             
         Returns:
-            List of paths to extracted autosupport files
+            List of (file name, content) pairs for the autosupport files found
         """
         autosupport_files = []
         
         try:
             with tarfile.open(tar_path, 'r:gz') as tar:
-                # Extract all files (filter='data' maintains current behavior and suppresses warning)
-                tar.extractall(path=temp_dir, filter='data')
+                # Read only the autosupport file, straight from the archive stream
+                # rather than via a temporary copy on disk. extractfile() resolves
+                # symlink and hardlink members within the archive, and a name that
+                # appears more than once keeps its last copy, as extractall() did
+                content = None
+                for member in tar:
+                    if posixpath.normpath(member.name.lstrip('/')) == _AUTOSUPPORT_MEMBER:
+                        try:
+                            reader = tar.extractfile(member)
+                        except KeyError:
+                            # Link whose target is not in the archive
+                            continue
+                        if reader is not None:
+                            with reader:
+                                content = reader.read()
                 
-                # Look for autosupport files in the expected location
-                support_dir = os.path.join(temp_dir, 'ddr', 'var', 'support')
-                if os.path.exists(support_dir):
-                    # Find the main autosupport file (without extension)
-                    autosupport_path = os.path.join(support_dir, 'autosupport')
-                    if os.path.exists(autosupport_path):
-                        autosupport_files.append(autosupport_path)
-                    
-                    # Also check for numbered autosupport files
-                    for file in os.listdir(support_dir):
-                        if re.match(r'^autosupport$', file) and file not in [os.path.basename(f) for f in autosupport_files]:
-                            full_path = os.path.join(support_dir, file)
-                            if os.path.isfile(full_path):
-                                autosupport_files.append(full_path)
+                if content is not None:
+                    autosupport_files.append((posixpath.basename(_AUTOSUPPORT_MEMBER), content))
                 
         except Exception as e:
             print(f"Error extracting {tar_path}: {e}")
             
         return autosupport_files
     
-    def extract_autosupport_from_eml(self, eml_path: str, temp_dir: str) -> List[str]:
+    def extract_autosupport_from_eml(self, eml_path: str) -> List[Tuple[str, bytes]]:
         """
         Extract autosupport content from .eml email files
         
         Args:
             eml_path: Path to .eml file
-            temp_dir: Temporary directory for extraction
             
         Returns:
-            List of paths to extracted autosupport content files
+            List of (file name, content) pairs for the autosupport content found
         """
         autosupport_files = []
         
         try:
-            with open(eml_path, 'r', encoding='utf-8', errors='ignore') as eml_file:
-                msg = email.message_from_file(eml_file)
+            # Parse the raw bytes: payloads are decoded straight from the message
+            # without first expanding the whole email into a str
+            with open(eml_path, 'rb') as eml_file:
+                msg = BytesParser(policy=compat32).parse(eml_file)
                 
-            # Extract autosupport content from email body
+            # Extract autosupport content from email body (kept as bytes). A single
+            # part message is its own body; in a multipart message only text/plain
+            # leaves can hold it, so containers and other types are skipped before
+            # their payloads are decoded
             autosupport_content = None
             
             if msg.is_multipart():
-                for part in msg.walk():
-                    content_type = part.get_content_type()
-                    if content_type == 'text/plain':
-                        body = part.get_payload(decode=True)
-                        if body:
-                            if isinstance(body, bytes):
-                                body_text = body.decode('utf-8', errors='ignore')
-                            else:
-                                body_text = str(body)
-                            # Check if this part contains autosupport data
-                            if 'GENERATED_ON=' in body_text and 'SYSTEM_SERIALNO=' in body_text:
-                                autosupport_content = body_text
-                                break
+                candidates = (part for part in msg.walk() if part.get_content_type() == 'text/plain')
             else:
-                # Single part message
-                body = msg.get_payload(decode=True)
-                if body:
-                    if isinstance(body, bytes):
-                        body_text = body.decode('utf-8', errors='ignore')
-                    else:
-                        body_text = str(body)
-                    if 'GENERATED_ON=' in body_text and 'SYSTEM_SERIALNO=' in body_text:
-                        autosupport_content = body_text
+                candidates = [msg]
+            
+            for part in candidates:
+                body = part.get_payload(decode=True)
+                # Check if this part contains autosupport data; stop at the first match
+                if body and b'GENERATED_ON=' in body and b'SYSTEM_SERIALNO=' in body:
+                    autosupport_content = body
+                    break
             
             if autosupport_content:
-                # Create temporary autosupport file
+                # Name the content after the email it came from
                 eml_basename = os.path.splitext(os.path.basename(eml_path))[0]
-                autosupport_file = os.path.join(temp_dir, f'autosupport_{eml_basename}')
-                
-                with open(autosupport_file, 'w', encoding='utf-8') as f:
-                    f.write(autosupport_content)
-                
-                autosupport_files.append(autosupport_file)
+                autosupport_files.append((f'autosupport_{eml_basename}', autosupport_content))
             else:
                 print(f"No autosupport data found in {eml_path}")
                 
@@ -145,40 +789,77 @@ class AutosupportParser:
             
         return autosupport_files
     
-    def parse_autosupport_file(self, file_path: str) -> Dict[str, Any]:
+    def parse_autosupport_file(self, file_path: str, source_tar: str = 'N/A') -> Dict[str, Any]:
         """
         Parse an autosupport file and extract required fields
         
         Args:
             file_path: Path to the autosupport file
+            source_tar: Name of the tar.gz or .eml file it came from
             
         Returns:
             Dictionary containing extracted field values
         """
-        data: Dict[str, Any] = {}
-        
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-            # Extract each required field using regex
-            for field in self.REQUIRED_FIELDS:
-                pattern = rf'^{field}=(.*)$'
-                match = re.search(pattern, content, re.MULTILINE)
-                if match:
-                    data[field] = match.group(1).strip()
+            with open(file_path, 'rb') as f:
+                # Memory-map the file so the patterns scan the OS page cache
+                # directly rather than a decoded copy of the whole file
+                # (an empty file cannot be mapped, so use empty bytes instead)
+                if os.fstat(f.fileno()).st_size:
+                    mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
                 else:
-                    data[field] = 'N/A'
+                    mapping = contextlib.nullcontext(b'')
+                with mapping as content:
+                    return self.parse_autosupport_content(content, os.path.basename(file_path), source_tar)
                 
+        except Exception as e:
+            print(f"Error parsing {file_path}: {e}")
+            return self._error_entry(os.path.basename(file_path), source_tar)
+    
+    def parse_autosupport_content(self, content: bytes, source_file: str, source_tar: str = 'N/A') -> Dict[str, Any]:
+        """
+        Parse autosupport content already held in memory and extract required fields
+        
+        Args:
+            content: Raw autosupport content (bytes or memory-mapped file)
+            source_file: Name of the autosupport file
+            source_tar: Name of the tar.gz or .eml file it came from
+            
+        Returns:
+            Dictionary containing extracted field values
+        """
+        # Autosupport files never change once generated, so a cached result for
+        # identical content can be reused instead of parsing again
+        cache_path = None
+        if self.cache_dir:
+            digest = hashlib.sha1(content).hexdigest()
+            cache_path = os.path.join(self.cache_dir, f'{digest}-v{_CACHE_VERSION}.json')
+            data = self._load_cached_entry(cache_path)
+            if data is not None:
+                data['SOURCE_FILE'] = source_file
+                data['SOURCE_TAR'] = source_tar
+                return data
+        
+        data: Dict[str, Any] = self._EMPTY_ENTRY.copy()
+        
+        try:
+            # Extract all required fields in a single scan (first occurrence wins)
+            found = {}
+            for match in self._FIELDS_RE.finditer(content):
+                field = match.group(1).decode('ascii')
+                if field not in found:
+                    found[field] = _decode(match.group(2)).strip()
+                    if len(found) == len(self.REQUIRED_FIELDS):
+                        break  # All fields found, no need to scan the rest of the file
+            data.update(found)
+            
             # Parse services status
-            services_status = self.parse_services_status(content)
-            for service, status in services_status.items():
-                data[service] = status
-                
+            data.update(self.parse_services_status(content))
+            
             # Parse storage tables
             storage_data = self.parse_storage_tables(content)
             data['STORAGE_TABLES'] = storage_data
-                
+            
             # Parse cloud tier information if Cloud Tier is enabled
             if data.get('CLOUD_TIER') == 'Enabled':
                 cloud_profiles = self.parse_cloud_profiles(content)
@@ -188,26 +869,81 @@ class AutosupportParser:
             else:
                 data['CLOUD_PROFILES'] = []
                 data['CLOUD_DATA_MOVEMENT'] = []
-                        
+            
+            if cache_path:
+                self._store_cached_entry(cache_path, data)
+            
             # Add source file information
-            data['SOURCE_FILE'] = os.path.basename(file_path)
-            data['SOURCE_TAR'] = getattr(self, '_current_tar', 'N/A')
+            data['SOURCE_FILE'] = source_file
+            data['SOURCE_TAR'] = source_tar
                 
         except Exception as e:
-            print(f"Error parsing {file_path}: {e}")
-            # Return empty data with N/A values
-            data = {field: 'N/A' for field in self.REQUIRED_FIELDS}
-            # Add services with Unknown status
-            for service in self.SERVICES:
-                data[service] = 'Unknown'
-            # Add empty storage tables
-            data['STORAGE_TABLES'] = {}
-            data['SOURCE_FILE'] = os.path.basename(file_path)
-            data['SOURCE_TAR'] = getattr(self, '_current_tar', 'N/A')
+            print(f"Error parsing {source_file}: {e}")
+            data = self._error_entry(source_file, source_tar)
+            
+        return data
+    
+    def _load_cached_entry(self, cache_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a cached parse result
+        
+        Args:
+            cache_path: Path to the cached JSON result
+            
+        Returns:
+            Parsed data dictionary, or None if not cached or unreadable
+        """
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _store_cached_entry(self, cache_path: str, data: Dict[str, Any]) -> None:
+        """
+        Save a parse result to the cache
+        
+        Args:
+            cache_path: Path to the cached JSON result
+            data: Parsed data dictionary (without source information)
+        """
+        # Write to a private file first so concurrent workers never read a partial result
+        temp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Serialise in memory and write once: json.dump() streams many small
+            # fragments through the file object and is several times slower
+            payload = json.dumps(data)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Warning: could not write cache file {cache_path}: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+    
+    def _error_entry(self, source_file: str, source_tar: str) -> Dict[str, Any]:
+        """
+        Build the entry returned for an autosupport file that could not be parsed
+        
+        Args:
+            source_file: Name of the autosupport file
+            source_tar: Name of the tar.gz or .eml file it came from
             
+        Returns:
+            Dictionary of N/A fields and Unknown services with empty storage tables
+        """
+        data = self._EMPTY_ENTRY.copy()
+        data['STORAGE_TABLES'] = {}
+        data['SOURCE_FILE'] = source_file
+        data['SOURCE_TAR'] = source_tar
         return data
     
-    def get_hostname_prefix(self, hostname: str) -> str:
+    # The helpers below are pure functions of their argument and see the same
+    # hostnames, timestamps and locations over and over, so results are cached
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_hostname_prefix(hostname: str) -> str:
         """
         Extract hostname prefix (before first period)
         
@@ -219,9 +955,11 @@ class AutosupportParser:
         """
         if not hostname or hostname == 'N/A':
             return 'unknown'
-        return hostname.split('.')[0]
+        return hostname.partition('.')[0]
     
-    def get_date_suffix_from_generated_on(self, generated_on: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_date_suffix_from_generated_on(generated_on: str) -> str:
         """
         Extract date suffix in mmddyyyy format from GENERATED_ON field
         
@@ -235,38 +973,22 @@ class AutosupportParser:
             return 'unknown'
             
         try:
-            # Parse various date formats commonly found in autosupport
-            # Examples: "Fri Dec  6 06:16:27 EST 2024", "Fri Oct 17 06:03:20 EDT 2025"
-            from datetime import datetime
-            
-            # Remove timezone info and extra spaces for easier parsing
-            cleaned_date = re.sub(r'\s+', ' ', generated_on.strip())
-            
-            # Try different date format patterns
-            date_patterns = [
-                '%a %b %d %H:%M:%S %Z %Y',  # Fri Dec  6 06:16:27 EST 2024
-                '%a %b %d %H:%M:%S %Y',     # Fri Dec  6 06:16:27 2024
-                '%b %d %H:%M:%S %Z %Y',     # Dec  6 06:16:27 EST 2024
-                '%b %d %H:%M:%S %Y',        # Dec  6 06:16:27 2024
-            ]
-            
-            # Remove timezone abbreviations that might interfere
-            for tz in ['EST', 'EDT', 'CST', 'CDT', 'MST', 'MDT', 'PST', 'PDT', 'UTC']:
-                cleaned_date = cleaned_date.replace(f' {tz} ', ' ')
-            
+            # Match the whole timestamp in one go; any timezone token is skipped
+            # by the pattern itself, so no per-timezone replace pass is needed
             parsed_date = None
-            for pattern in date_patterns:
+            match = _GENERATED_ON_RE.fullmatch(generated_on.strip())
+            month = _MONTHS.get(match.group(1).lower()) if match else None
+            if month:
                 try:
-                    parsed_date = datetime.strptime(cleaned_date, pattern)
-                    break
+                    parsed_date = datetime(int(match.group(3)), month, int(match.group(2)))
                 except ValueError:
-                    continue
+                    pass  # Impossible date (e.g. Feb 30), use the fallback below
             
             if parsed_date:
                 return f"{parsed_date.month:02d}{parsed_date.day:02d}{parsed_date.year}"
             else:
                 # Fallback: try to extract numbers that look like a date
-                numbers = re.findall(r'\d+', generated_on)
+                numbers = _DIGITS_RE.findall(generated_on)
                 if len(numbers) >= 3:
                     # Assume format has month, day, year somewhere
                     month = int(numbers[1]) if len(numbers) > 1 and 1 <= int(numbers[1]) <= 12 else 1
@@ -301,7 +1023,9 @@ class AutosupportParser:
             # For .tar.gz files, use just hostname prefix
             return hostname_prefix
     
-    def get_location_folder(self, location: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_location_folder(location: str) -> str:
         """
         Get sanitized location name for folder creation
         
@@ -315,84 +1039,112 @@ class AutosupportParser:
             return 'unknown_location'
         
         # Sanitize location name for filesystem compatibility
-        # Remove/replace characters that might cause issues in folder names
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', location.strip())
-        sanitized = re.sub(r'\s+', '_', sanitized)  # Replace spaces with underscores
+        # Replace characters that might cause issues in folder names and runs of
+        # spaces with underscores, in a single pass
+        sanitized = _UNSAFE_FOLDER_RE.sub('_', location.strip())
         return sanitized if sanitized else 'unknown_location'
     
-    def parse_services_status(self, content: str) -> Dict[str, str]:
+    def _group_by_location(self, data: List[Dict[str, Any]]) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """
+        Group parsed entries by location folder, then by output file identifier
+        
+        Args:
+            data: List of parsed data dictionaries
+            
+        Returns:
+            Mapping of location folder to file identifier to entries, in input order
+        """
+        location_groups = defaultdict(lambda: defaultdict(list))
+        for entry in data:
+            location = entry.get('LOCATION', 'unknown')
+            location_folder = self.get_location_folder(location)
+            hostname = entry.get('HOSTNAME', 'unknown')
+            generated_on = entry.get('GENERATED_ON', 'unknown')
+            source_tar = entry.get('SOURCE_TAR', 'unknown')
+            file_identifier = self.get_file_identifier(hostname, generated_on, source_tar)
+            
+            location_groups[location_folder][file_identifier].append(entry)
+        
+        return location_groups
+    
+    def parse_services_status(self, content: bytes) -> Dict[str, str]:
         """
         Parse service status from autosupport content
         
         Args:
-            content: Full autosupport file content
+            content: Full autosupport file content (bytes or memory-mapped file)
             
         Returns:
             Dictionary containing service status
         """
         services_status = {}
         
+        # Lowercase once so the case-insensitive checks below can use cheap
+        # substring probes, skipping the regex entirely when a keyword is absent
+        low = _lowercase(content)
+        
         # NFS Status
-        if re.search(r'The NFS system is currently active and running', content, re.IGNORECASE):
+        if _NFS_ACTIVE_HINT in low:
             services_status['NFS'] = 'Enabled'
-        elif re.search(r'NFS.*disabled|NFS.*not.*running', content, re.IGNORECASE):
+        elif b'nfs' in low and _NFS_DISABLED_RE.search(low):
             services_status['NFS'] = 'Disabled'
         else:
             services_status['NFS'] = 'Unknown'
         
         # CIFS Status
-        if re.search(r'CIFS is disabled', content, re.IGNORECASE):
+        if _CIFS_DISABLED_HINT in low:
             services_status['CIFS'] = 'Disabled'
-        elif re.search(r'CIFS.*enabled|CIFS.*active', content, re.IGNORECASE):
+        elif b'cifs' in low and _CIFS_ENABLED_RE.search(low):
             services_status['CIFS'] = 'Enabled'
         else:
             services_status['CIFS'] = 'Unknown'
         
         # NDMP Status
-        if re.search(r'NDMP daemon admin_state: disabled', content, re.IGNORECASE):
+        if _NDMP_DISABLED_HINT in low:
             services_status['NDMP'] = 'Disabled'
-        elif re.search(r'NDMP daemon admin_state: enabled', content, re.IGNORECASE):
+        elif _NDMP_ENABLED_HINT in low:
             services_status['NDMP'] = 'Enabled'
         else:
             services_status['NDMP'] = 'Unknown'
         
-        # Cloud Tier Status
-        if re.search(r'CLOUD TIER.*:', content) or re.search(r'Cloud Unit:', content):
+        # Cloud Tier Status (section markers are case-sensitive, so probe the
+        # original content; find() because mmap's "in" only tests single bytes)
+        if _CLOUD_TIER_SECTION_RE.search(content) or content.find(_CLOUD_UNIT_HINT) != -1:
             services_status['CLOUD_TIER'] = 'Enabled'
-        elif re.search(r'cloud.*disabled', content, re.IGNORECASE):
+        elif b'disabled' in low and _CLOUD_DISABLED_RE.search(low):
             services_status['CLOUD_TIER'] = 'Disabled'
         else:
             services_status['CLOUD_TIER'] = 'Unknown'
         
         # Replication Status
-        if re.search(r'Enabled:\s+yes', content, re.IGNORECASE):
+        if b'enabled:' in low and _REPL_ENABLED_RE.search(low):
             services_status['REPLICATION'] = 'Enabled'
-        elif re.search(r'Enabled:\s+no|replication.*disabled', content, re.IGNORECASE):
+        elif _REPL_DISABLED_RE.search(low):
             services_status['REPLICATION'] = 'Disabled'
-        elif re.search(r'Replication Status', content):
+        elif content.find(_REPL_STATUS_HINT) != -1:
             services_status['REPLICATION'] = 'Configured'
         else:
             services_status['REPLICATION'] = 'Unknown'
         
         return services_status
     
-    def parse_mtree_retention_locks(self, content: str) -> Dict[str, Dict[str, str]]:
+    def parse_mtree_retention_locks(self, content: bytes) -> Dict[str, Dict[str, str]]:
         """
         Parse retention lock information for each mtree
         
         Args:
-            content: Raw autosupport content
+            content: Raw autosupport content (bytes or memory-mapped file)
             
         Returns:
             Dictionary mapping mtree paths to their retention lock info
         """
         retention_locks = {}
         
-        # Find all mtree retention lock sections
-        pattern = r'Mtree: (/data/col1/[^\s]+)\s*\n\s*Option\s+Value\s*\n-+\s+-+\s*\n(.*?)\n-+\s+-+(?=\s*\n|$)'
-        matches = re.findall(pattern, content, re.DOTALL | re.MULTILINE)
-        
-        for mtree_path, options_section in matches:
+        # Walk the mtree retention lock sections one at a time rather than
+        # collecting them all first
+        for match in _MTREE_RETENTION_RE.finditer(content):
+            mtree_path = _decode(match.group(1))
+            options_section = _decode(match.group(2))
             retention_info = {
                 'Retention_Lock': 'disabled',
                 'Lock_Mode': 'N/A',
@@ -402,53 +1154,42 @@ class AutosupportParser:
             
             # Parse the options section
             for line in options_section.strip().split('\n'):
-                if not line.strip():
+                stripped = line.strip()
+                if not stripped:
                     continue
                     
                 # Split on multiple spaces to handle the table format
-                parts = re.split(r'\s{2,}', line.strip())
+                parts = _MULTI_SPACE_RE.split(stripped)
                 if len(parts) >= 2:
-                    option = parts[0].strip()
-                    value = parts[1].strip()
-                    
-                    if option == 'Retention-lock':
-                        # Handle values like "enabled" or "disabled (never enabled)"
-                        if value.lower().startswith('enabled'):
-                            retention_info['Retention_Lock'] = 'enabled'
-                        else:
-                            retention_info['Retention_Lock'] = 'disabled'
-                            
-                    elif option == 'Retention-lock mode':
-                        retention_info['Lock_Mode'] = value if value != 'N/A' else 'N/A'
-                        
-                    elif option == 'Retention-lock min-retention-period':
-                        retention_info['Min_Retention_Period'] = value
-                        
-                    elif option == 'Retention-lock max-retention-period':
-                        retention_info['Max_Retention_Period'] = value
+                    field = _RETENTION_OPTION_FIELDS.get(parts[0].strip())
+                    if field:
+                        value = parts[1].strip()
+                        if field == 'Retention_Lock':
+                            # Handle values like "enabled" or "disabled (never enabled)"
+                            value = 'enabled' if value.lower().startswith('enabled') else 'disabled'
+                        # Few distinct values repeat across every mtree; intern them
+                        retention_info[field] = sys.intern(value)
             
             retention_locks[mtree_path] = retention_info
         
         return retention_locks
     
-    def parse_mtree_replication_info(self, content: str) -> Dict[str, Dict[str, str]]:
+    def parse_mtree_replication_info(self, content: bytes) -> Dict[str, Dict[str, str]]:
         """
         Parse replication information for each mtree
         
         Args:
-            content: Raw autosupport content
+            content: Raw autosupport content (bytes or memory-mapped file)
             
         Returns:
             Dictionary mapping mtree paths to their replication info
         """
         replication_info = {}
         
-        # Find all replication context sections
-        pattern = r'CTX:\s+\d+\s*\n(.*?)(?=CTX:\s+\d+|Replication Options|$)'
-        matches = re.findall(pattern, content, re.DOTALL)
-        
-        for section in matches:
-            lines = section.strip().split('\n')
+        # Walk the replication context sections one at a time rather than
+        # collecting them all first
+        for match in _REPL_CONTEXT_RE.finditer(content):
+            lines = _decode(match.group(1)).strip().split('\n')
             replication_data = {
                 'Mode': 'N/A',
                 'Connection_Host': 'N/A', 
@@ -457,28 +1198,24 @@ class AutosupportParser:
             mtree_path = None
             
             for line in lines:
-                line = line.strip()
-                if line.startswith('Mode:'):
-                    mode_value = line.split(':', 1)[1].strip()
-                    replication_data['Mode'] = mode_value
+                # Split "Label: value" once and dispatch on the label
+                label, sep, value = line.strip().partition(':')
+                if not sep:
+                    continue
+                value = value.strip()
+                
+                if label in ('Mode', 'Enabled'):
+                    # Few distinct values repeat across every context; intern them
+                    replication_data[label] = sys.intern(value)
                     
-                elif line.startswith('Destination:'):
-                    dest_value = line.split(':', 1)[1].strip()
+                elif label == 'Destination':
                     # Extract mtree path from destination like: mtree://host.domain/data/col1/mtree_name
-                    if '/data/col1/' in dest_value:
-                        mtree_path = '/data/col1/' + dest_value.split('/data/col1/')[-1]
+                    if '/data/col1/' in value:
+                        mtree_path = '/data/col1/' + value.split('/data/col1/')[-1]
                         
-                elif line.startswith('Connection Host:'):
-                    host_value = line.split(':', 1)[1].strip()
+                elif label == 'Connection Host':
                     # Extract just the hostname without domain
-                    if '.' in host_value:
-                        replication_data['Connection_Host'] = host_value.split('.')[0]
-                    else:
-                        replication_data['Connection_Host'] = host_value
-                        
-                elif line.startswith('Enabled:'):
-                    enabled_value = line.split(':', 1)[1].strip()
-                    replication_data['Enabled'] = enabled_value
+                    replication_data['Connection_Host'] = sys.intern(value.split('.')[0])
             
             # Only add if we found a valid mtree path
             if mtree_path:
@@ -486,12 +1223,12 @@ class AutosupportParser:
         
         return replication_info
     
-    def parse_cloud_profiles(self, content: str) -> List[Dict[str, str]]:
+    def parse_cloud_profiles(self, content: bytes) -> List[Dict[str, str]]:
         """
         Parse cloud profiles information
         
         Args:
-            content: Raw autosupport content
+            content: Raw autosupport content (bytes or memory-mapped file)
             
         Returns:
             List of cloud profile dictionaries
@@ -499,14 +1236,13 @@ class AutosupportParser:
         cloud_profiles = []
         
         # Find Cloud Profiles section
-        profiles_pattern = r'Cloud Profiles\s*\n-{10,}\s*\n(.*?)(?=\nCloud Unit List|\nCloud Data-Movement|$)'
-        match = re.search(profiles_pattern, content, re.DOTALL)
+        match = _CLOUD_PROFILES_RE.search(content)
         
         if match:
-            profiles_section = match.group(1)
+            profiles_section = _decode(match.group(1))
             
             # Split by Profile name to get individual profiles
-            profile_blocks = re.split(r'(?=Profile name:)', profiles_section)
+            profile_blocks = _PROFILE_SPLIT_RE.split(profiles_section)
             
             for block in profile_blocks:
                 if not block.strip() or 'Profile name:' not in block:
@@ -514,35 +1250,19 @@ class AutosupportParser:
                     
                 profile_data = {}
                 
-                # Process line by line for more accurate field extraction
-                lines = block.split('\n')
-                for line in lines:
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    # Extract each field from its specific line
-                    if line.startswith('Profile name:'):
-                        profile_data['Profile_Name'] = line.split('Profile name:')[1].strip()
-                    elif line.startswith('Provider:'):
-                        profile_data['Provider'] = line.split('Provider:')[1].strip()
-                    elif line.startswith('Endpoint:'):
-                        profile_data['Endpoint'] = line.split('Endpoint:')[1].strip()
-                    elif line.startswith('Version:'):
-                        profile_data['Version'] = line.split('Version:')[1].strip()
-                    elif line.startswith('Proxy host:'):
-                        proxy_host = line.split('Proxy host:')[1].strip()
-                        profile_data['Proxy_Host'] = proxy_host if proxy_host else 'N/A'
-                    elif line.startswith('Proxy port:'):
-                        proxy_port = line.split('Proxy port:')[1].strip()
-                        profile_data['Proxy_Port'] = proxy_port if proxy_port else 'N/A'
-                    elif line.startswith('Proxy username:'):
-                        proxy_username = line.split('Proxy username:')[1].strip()
-                        profile_data['Proxy_Username'] = proxy_username if proxy_username else 'N/A'
+                # Pull each field straight from its line (value already stripped);
+                # a repeated label keeps its last value, as the line-by-line scan did
+                for field, pattern in _CLOUD_PROFILE_FIELDS:
+                    field_matches = pattern.findall(block)
+                    if field_matches:
+                        profile_data[field] = field_matches[-1]
                 
-                # Set default values for any missing optional fields
-                for field in ['Version', 'Proxy_Host', 'Proxy_Port', 'Proxy_Username']:
-                    if field not in profile_data:
+                # Set default values for any missing optional fields (blank proxy
+                # settings are reported as N/A too)
+                if 'Version' not in profile_data:
+                    profile_data['Version'] = 'N/A'
+                for field in ['Proxy_Host', 'Proxy_Port', 'Proxy_Username']:
+                    if not profile_data.get(field):
                         profile_data[field] = 'N/A'
                 
                 # Only add profile if we found at least the basic required fields
@@ -551,12 +1271,12 @@ class AutosupportParser:
         
         return cloud_profiles
     
-    def parse_cloud_data_movement(self, content: str) -> List[Dict[str, str]]:
+    def parse_cloud_data_movement(self, content: bytes) -> List[Dict[str, str]]:
         """
         Parse cloud data-movement configuration
         
         Args:
-            content: Raw autosupport content
+            content: Raw autosupport content (bytes or memory-mapped file)
             
         Returns:
             List of cloud data-movement configuration dictionaries
@@ -564,75 +1284,39 @@ class AutosupportParser:
         cloud_movement = []
         
         # Find Cloud Data-Movement Configuration section
-        movement_pattern = r'Cloud Data-Movement Configuration\s*\n-{30,}(.*?)(?=\nData-movement is scheduled)'
-        match = re.search(movement_pattern, content, re.DOTALL)
+        match = _CLOUD_MOVEMENT_RE.search(content)
         
         if match:
-            movement_section = match.group(1).strip()
+            movement_section = _decode(match.group(1)).strip()
             
-            # Parse each line of the table
+            # Parse each line of the table; splitting on column gaps rather than
+            # fixed column widths keeps long mtree or unit names intact
             for line in movement_section.split('\n'):
-                line = line.strip()
-                if line and not line.startswith('-') and not line.startswith('Mtree') and 'Target(Tier/Unit Name)' not in line:
-                    # Parse fixed-width format: Mtree (28 chars), Target (26 chars), Policy (13 chars), Value (rest)
-                    if len(line) > 60 and line.startswith('/data/col1/'):
-                        # Extract mtree (first ~28 characters)
-                        mtree = line[:28].strip()
-                        remainder = line[28:].strip()
-                        
-                        # Extract target (next ~26 characters)  
-                        target = remainder[:26].strip()
-                        remainder = remainder[26:].strip()
-                        
-                        # Extract policy (next ~13 characters)
-                        policy = remainder[:13].strip()
-                        value = remainder[13:].strip()
-                        
-                        if mtree and target and policy and value:
-                            cloud_movement.append({
-                                'Mtree': mtree,
-                                'Target': target,
-                                'Policy': policy,
-                                'Value': value
-                            })
+                row = _CLOUD_MOVEMENT_ROW_RE.match(line.strip())
+                if row:
+                    cloud_movement.append({
+                        'Mtree': row.group(1),
+                        'Target': row.group(2),
+                        'Policy': row.group(3),
+                        'Value': row.group(4)
+                    })
         
         return cloud_movement
     
-    def parse_storage_tables(self, content: str) -> Dict[str, Any]:
+    def parse_storage_tables(self, content: bytes) -> Dict[str, Any]:
         """
         Parse storage tables (Active Tier, Cloud Tier, Total) from autosupport content
         
         Args:
-            content: Full autosupport file content
+            content: Full autosupport file content (bytes or memory-mapped file)
             
         Returns:
             Dictionary containing storage table data and notes
         """
         storage_data = {}
         
-        # Define patterns for storage usage tables
-        storage_usage_patterns = {
-            'Active Tier Usage': r'Active Tier:\s*\nResource.*?\n(.*?)(?=\n\s*\* |\n\s*Cloud Tier|\Z)',
-            'Cloud Tier Usage': r'Cloud Tier\s*\nResource.*?\n(.*?)(?=\n\s*\* |\n\s*Total:|\Z)',
-            'Total Usage': r'Total:\s*\nResource.*?\n(.*?)(?=\n\s*\* |\Z)'
-        }
-        
-        # Define patterns for compression statistics tables
-        compression_patterns = {
-            'Active Tier Compression': r'Active Tier:\s*\n\s*Pre-Comp.*?Total-Comp.*?\n.*?\n(.*?)(?=\n\s*\*.*?cleaning|\n\s*Cloud Tier:)',
-            'Cloud Tier Compression': r'(?s)Filesys Compression.*?Cloud Tier:\s*\n.*?-{10,}\s*\n(.*?)(?=\n\s*\* Does not include)', 
-            'Currently Used Summary': r'Currently Used:\*\s*\n\s*Pre-Comp.*?Total-Comp.*?\n.*?\n(.*?)(?=\n\s*Key:)'
-        }
-        
-        # Define patterns for Mtree Show Compression tables (optimized to avoid catastrophic backtracking)
-        mtree_patterns = {
-            'Mtree Active Tier Compression': r'Mtree Show Compression[^\n]*\n(?:[^\n]*\n)*?Active Tier:[^\n]*\n(?:-{10,}[^\n]*\n)([^-]*?)(?:-{10,}|Cloud Tier:)',
-            'Mtree Cloud Tier Compression': r'Mtree Show Compression[^\n]*\n(?:[^\n]*\n)*?Cloud Tier:[^\n]*\n(?:-{10,}[^\n]*\n)([^-]*?)(?:-{10,}|Key:)',
-            'Mtree List': r'Mtree List\s*\n-{5,}\s*\nName[^\n]*Pre-Comp[^\n]*Status[^\n]*\n-{10,}[^\n]*\n((?:/data/col1/[^\n]*\n)*?)(?=-{10,}|\nMtree Options|\Z)'
-        }
-        
         # Combine all table patterns
-        table_patterns = {**storage_usage_patterns, **compression_patterns, **mtree_patterns}
+        table_patterns = {**_STORAGE_USAGE_PATTERNS, **_COMPRESSION_PATTERNS, **_MTREE_PATTERNS}
         
         # Parse retention lock data for mtrees (needed for enhanced Mtree List)
         retention_locks = self.parse_mtree_retention_locks(content)
@@ -640,42 +1324,60 @@ class AutosupportParser:
         # Parse replication information for mtrees (needed for enhanced Mtree List)
         replication_info = self.parse_mtree_replication_info(content)
         
+        # Offsets of the section headers, each located once per file (several
+        # tables share a header) so every table search starts at its section
+        section_offsets = {}
+        
         for table_name, pattern in table_patterns.items():
-            match = re.search(pattern, content, re.DOTALL | re.MULTILINE)
+            prerequisites = _TABLE_PREREQUISITES[table_name]
+            header = prerequisites[0]
+            if header not in section_offsets:
+                section_offsets[header] = content.find(header)
+            match = _search_table(pattern, content, prerequisites, section_offsets[header])
             if match:
-                table_section = match.group(1)
+                table_section = _decode(match.group(1))
                 rows = []
                 
                 # Split into lines and process
                 lines = table_section.strip().split('\n')
                 
-                # Determine table type based on name
-                is_compression_table = 'Compression' in table_name or 'Currently Used' in table_name
-                is_usage_table = 'Usage' in table_name
-                is_mtree_table = 'Mtree' in table_name
-                
-
+                # Determine table type once so each line takes a single branch
+                if 'Mtree List' in table_name:
+                    active_table = 'mtree_list'
+                elif 'Mtree' in table_name:
+                    active_table = 'mtree_compression'
+                elif 'Usage' in table_name:
+                    active_table = 'usage'
+                else:
+                    active_table = 'compression'
                 
                 for line in lines:
+                    stripped = line.strip()
+                    
                     # Skip separator lines and empty lines
-                    if '----' in line or '-----------' in line or not line.strip():
+                    if not stripped or '----' in stripped:
                         continue
                     
                     # Skip header lines
-                    if any(header in line for header in ['Resource', 'Size GiB', 'Pre-Comp', 'Post-Comp']):
+                    if _TABLE_HEADER_RE.search(stripped):
                         continue
                     
+                    is_mtree_row = stripped.startswith('/data/col1/')
+                    
                     # Process Mtree List table data lines
-                    if is_mtree_table and 'Mtree List' in table_name and line.strip() and line.strip().startswith('/data/col1/'):
-                        clean_line = re.sub(r'\*', '', line).strip()
+                    if active_table == 'mtree_list':
+                        if not is_mtree_row:
+                            continue
+                        clean_line = stripped.replace('*', '').strip()
                         
                         # Parse mtree list format using flexible space-separated columns
                         # Split on multiple spaces (2 or more) to handle variable-length names
-                        parts = re.split(r'\s{2,}', clean_line)
+                        parts = _MULTI_SPACE_RE.split(clean_line)
                         if len(parts) >= 3:
                             mtree_name = parts[0].strip()
                             pre_comp_size = parts[1].strip()
-                            status = parts[2].strip()
+                            # Status takes a handful of values; share one string per value
+                            status = sys.intern(parts[2].strip())
                             
                             # Get retention lock info for this mtree
                             retention_info = retention_locks.get(mtree_name, {
@@ -706,57 +1408,19 @@ class AutosupportParser:
                             }
                             rows.append(row)
                     
-                    # Process Mtree compression table data lines (MUST come before usage table check)
-                    elif is_mtree_table and line.strip() and line.strip().startswith('/data/col1/'):
-                        clean_line = re.sub(r'\*', '', line).strip()
-                        
-                        # Parse mtree compression table format - find where numeric data starts
-                        if len(clean_line) > 35:
-                            # Find the position where numeric data starts (after the mtree path)
-                            # Look for the first digit after spaces following the mtree path
-                            match_data = re.match(r'^(/data/col1/[^\s]+)\s+(.*)', clean_line)
-                            if match_data:
-                                mtree_name = match_data.group(1)
-                                remainder = match_data.group(2).strip()
-                                values = remainder.split()
-                                
-                                if len(values) >= 10:  # Should have 10 values (5 for 24hrs, 5 for 7days)
-                                    # Helper function to split Total(Reduction%) values
-                                    def split_total_reduction(value):
-                                        if '(' in value and ')' in value:
-                                            total_val = value.split('(')[0]
-                                            reduction_val = value.split('(')[1].rstrip(')')
-                                            return total_val, reduction_val
-                                        else:
-                                            return value, 'N/A'
-                                    
-                                    # Split the Total_24hrs column
-                                    total_24hrs, reduction_24hrs = split_total_reduction(values[4] if values[4] != '-' else 'N/A')
-                                    
-                                    # Split the Total_7days column  
-                                    total_7days, reduction_7days = split_total_reduction(values[9] if values[9] != '-' else 'N/A')
-                                    
-                                    row = {
-                                        'Mtree': mtree_name,
-                                        'Pre_24hrs_GiB': values[0] if values[0] != '-' else 'N/A',
-                                        'Post_24hrs_GiB': values[1] if values[1] != '-' else 'N/A',
-                                        'Global_24hrs': values[2] if values[2] != '-' else 'N/A',
-                                        'Local_24hrs': values[3] if values[3] != '-' else 'N/A',
-                                        'Total_24hrs': total_24hrs,
-                                        'Reduction_24hrs_Percent': reduction_24hrs,
-                                        'Pre_7days_GiB': values[5] if values[5] != '-' else 'N/A',
-                                        'Post_7days_GiB': values[6] if values[6] != '-' else 'N/A',
-                                        'Global_7days': values[7] if values[7] != '-' else 'N/A',
-                                        'Local_7days': values[8] if values[8] != '-' else 'N/A',
-                                        'Total_7days': total_7days,
-                                        'Reduction_7days_Percent': reduction_7days
-                                    }
-                                    rows.append(row)
+                    # Process Mtree compression table data lines; other lines fall through to the compression branch
+                    elif active_table == 'mtree_compression' and is_mtree_row:
+                        row = _parse_mtree_compression_row(stripped)
+                        if row:
+                            rows.append(row)
                     
                     # Process usage table data lines (those starting with /)
-                    elif is_usage_table and line.strip().startswith('/'):
+                    elif active_table == 'usage':
+                        if not stripped.startswith('/'):
+                            continue
+                        
                         # Clean the line
-                        clean_line = re.sub(r'\*', '', line).strip()
+                        clean_line = stripped.replace('*', '').strip()
                         
                         # Parse the fixed-width format
                         if len(clean_line) > 18:
@@ -764,23 +1428,20 @@ class AutosupportParser:
                             remainder = clean_line[18:].strip()
                             values = remainder.split()
                             
-                            if values and len(values) >= 1:
-                                row = {
-                                    'Resource': resource,
-                                    'Size_GiB': values[0] if len(values) > 0 else 'N/A',
-                                    'Used_GiB': values[1] if len(values) > 1 else 'N/A', 
-                                    'Avail_GiB': values[2] if len(values) > 2 else 'N/A',
-                                    'Use_Percent': values[3] if len(values) > 3 else 'N/A',
-                                    'Cleanable_GiB': values[4] if len(values) > 4 else 'N/A'
-                                }
-                                rows.append(row)
+                            if values:
+                                # Pad missing trailing columns with N/A
+                                cells = [resource, *values[:5]] + ['N/A'] * (5 - len(values))
+                                rows.append(dict(zip(_USAGE_COLUMNS, cells)))
                     
                     # Process compression table data lines
-                    elif is_compression_table and line.strip() and not line.strip().startswith('(') and not line.strip().startswith('Key:'):
-                        clean_line = re.sub(r'\*', '', line).strip()
+                    else:
+                        if stripped.startswith(('(', 'Key:')):
+                            continue
+                        
+                        clean_line = stripped.replace('*', '').strip()
                         
                         # Parse compression table format
-                        if ':' in clean_line or any(tier in clean_line for tier in ['Currently Used', 'Last 7 days', 'Last 24 hrs', 'Active Tier', 'Cloud Tier', 'Total', 'Written']):
+                        if ':' in clean_line or _COMP_LABEL_RE.search(clean_line):
                             # Split on whitespace but preserve the metric name
                             parts = clean_line.split()
                             
@@ -810,28 +1471,30 @@ class AutosupportParser:
                                     values = parts[1:]
                                 
                                 if len(values) >= 2:
-                                    row = {
-                                        'Metric': metric,
-                                        'Pre_Comp_GiB': values[0] if len(values) > 0 else 'N/A',
-                                        'Post_Comp_GiB': values[1] if len(values) > 1 else 'N/A',
-                                        'Global_Comp_Factor': values[2] if len(values) > 2 else 'N/A',
-                                        'Local_Comp_Factor': values[3] if len(values) > 3 else 'N/A',
-                                        'Total_Comp_Factor': values[4] if len(values) > 4 else 'N/A'
-                                    }
-                                    rows.append(row)
+                                    cells = [metric, *values[:5]] + ['N/A'] * (5 - len(values))
+                                    rows.append(dict(zip(_COMPRESSION_COLUMNS, cells)))
                 
                 storage_data[table_name] = rows
                 
                 # Look for note after this table
-                note_start = content.find(table_section) + len(table_section)
-                note_section = content[note_start:note_start + 500]  # Look ahead for note
+                # Notes follow the matched table, so start right after it rather
+                # than searching the file again for the section text
+                note_start = match.end(1)
+                note_end = note_start + 500  # Look ahead for note
                 
+                # Note lines start with '*', so without one in the window there is
+                # nothing to decode; lines before the first '*' cannot be notes, so
+                # decoding starts at the line holding it
                 note_lines = []
-                for line in note_section.split('\n'):
-                    if line.strip().startswith('*'):
-                        note_lines.append(line.strip())
-                    elif line.strip() and not line.strip().startswith('*') and note_lines:
-                        break  # Stop at first non-note line after finding notes
+                first_star = content.find(b'*', note_start, note_end)
+                if first_star != -1:
+                    line_start = max(content.rfind(b'\n', note_start, first_star) + 1, note_start)
+                    for line in _decode(content[line_start:note_end]).split('\n'):
+                        stripped = line.strip()
+                        if stripped.startswith('*'):
+                            note_lines.append(stripped)
+                        elif stripped and note_lines:
+                            break  # Stop at first non-note line after finding notes
                 
                 if note_lines:
                     storage_data[f'{table_name}_note'] = ' '.join(note_lines)
@@ -850,24 +1513,23 @@ class AutosupportParser:
         """
         results = []
         
-        # Set current tar for tracking
-        self._current_tar = os.path.basename(tar_path)
+        # Source name recorded with each parsed entry
+        source_tar = os.path.basename(tar_path)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            print(f"Processing: {tar_path}")
-            
-            # Extract autosupport files
-            autosupport_files = self.extract_tar_gz(tar_path, temp_dir)
-            
-            if not autosupport_files:
-                print(f"  No autosupport files found in {tar_path}")
-                return results
-            
-            # Parse each autosupport file
-            for autosupport_file in autosupport_files:
-                print(f"  Parsing: {os.path.basename(autosupport_file)}")
-                data = self.parse_autosupport_file(autosupport_file)
-                results.append(data)
+        print(f"Processing: {tar_path}")
+        
+        # Extract autosupport files (held in memory, nothing is written to disk)
+        autosupport_files = self.extract_tar_gz(tar_path)
+        
+        if not autosupport_files:
+            print(f"  No autosupport files found in {tar_path}")
+            return results
+        
+        # Parse each autosupport file
+        for source_file, content in autosupport_files:
+            print(f"  Parsing: {source_file}")
+            data = self.parse_autosupport_content(content, source_file, source_tar)
+            results.append(data)
         
         return results
     
@@ -883,47 +1545,55 @@ class AutosupportParser:
         """
         results = []
         
-        # Set current source for tracking
-        self._current_tar = os.path.basename(eml_path)
+        # Source name recorded with each parsed entry
+        source_tar = os.path.basename(eml_path)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            print(f"Processing: {eml_path}")
-            
-            # Extract autosupport content from email
-            autosupport_files = self.extract_autosupport_from_eml(eml_path, temp_dir)
-            
-            if not autosupport_files:
-                print(f"  No autosupport data found in {eml_path}")
-                return results
-            
-            # Parse each autosupport file
-            for autosupport_file in autosupport_files:
-                print(f"  Parsing: {os.path.basename(autosupport_file)}")
-                data = self.parse_autosupport_file(autosupport_file)
-                results.append(data)
+        print(f"Processing: {eml_path}")
+        
+        # Extract autosupport content from email (held in memory, nothing is written to disk)
+        autosupport_files = self.extract_autosupport_from_eml(eml_path)
+        
+        if not autosupport_files:
+            print(f"  No autosupport data found in {eml_path}")
+            return results
+        
+        # Parse each autosupport file
+        for source_file, content in autosupport_files:
+            print(f"  Parsing: {source_file}")
+            data = self.parse_autosupport_content(content, source_file, source_tar)
+            results.append(data)
         
         return results
     
-    def process_directory(self, directory: str) -> List[Dict[str, Any]]:
+    def process_directory(self, directory: str, jobs: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Process all tar.gz and .eml files in a directory
         
         Args:
             directory: Path to directory containing tar.gz and/or .eml files
+            jobs: Number of worker processes (default: one per CPU core)
             
         Returns:
             List of all parsed data dictionaries
         """
         results = []
         
-        # Find all tar.gz and .eml files
+        # Find all tar.gz and .eml files; scandir reports the file type with each
+        # name, so only matching names are checked and usually without a stat()
         tar_files = []
         eml_files = []
-        for file in os.listdir(directory):
-            if file.endswith('.tar.gz'):
-                tar_files.append(os.path.join(directory, file))
-            elif file.endswith('.eml'):
-                eml_files.append(os.path.join(directory, file))
+        with os.scandir(directory) as dir_entries:
+            for dir_entry in dir_entries:
+                name = dir_entry.name
+                if name.endswith('.tar.gz'):
+                    file_list = tar_files
+                elif name.endswith('.eml'):
+                    file_list = eml_files
+                else:
+                    continue
+                # Skip subdirectories that happen to carry a matching suffix
+                if dir_entry.is_file():
+                    file_list.append(dir_entry.path)
         
         total_files = len(tar_files) + len(eml_files)
         if not total_files:
@@ -935,15 +1605,26 @@ class AutosupportParser:
         if eml_files:
             print(f"Found {len(eml_files)} .eml files to process")
         
-        # Process each tar file
-        for tar_file in sorted(tar_files):
-            file_results = self.process_single_tar(tar_file)
-            results.extend(file_results)
-        
-        # Process each eml file
-        for eml_file in sorted(eml_files):
-            file_results = self.process_single_eml(eml_file)
-            results.extend(file_results)
+        # Tar files first, then eml files, each in sorted order
+        input_files = sorted(tar_files) + sorted(eml_files)
+        workers = min(jobs or os.cpu_count() or 1, total_files)
+        
+        if workers > 1:
+            # Files are independent, so parse them in parallel worker processes;
+            # map() returns results (and their progress output) in input order
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                worker = partial(_process_input_file, parser_cls=type(self), cache_dir=self.cache_dir)
+                for file_results, output in executor.map(worker, input_files, chunksize=1):
+                    print(output, end='')
+                    results.extend(file_results)
+        else:
+            # Process each file in this process
+            for input_file in input_files:
+                if input_file.endswith('.eml'):
+                    file_results = self.process_single_eml(input_file)
+                else:
+                    file_results = self.process_single_tar(input_file)
+                results.extend(file_results)
         
         return results
     
@@ -958,197 +1639,153 @@ class AutosupportParser:
             print("No data to display")
             return
         
-        print("\n" + "="*80)
-        print("AUTOSUPPORT PARSING RESULTS")
-        print("="*80)
+        # Collect each entry's lines and write them with one print() call
+        # rather than one call per line
+        lines = []
+        out = lines.append
+        
+        out("\n" + "="*80)
+        out("AUTOSUPPORT PARSING RESULTS")
+        out("="*80)
         
         for i, entry in enumerate(data, 1):
-            print(f"\n--- Entry {i} ---")
+            get = entry.get
+            out(f"\n--- Entry {i} ---")
             for field in self.REQUIRED_FIELDS:
-                print(f"{field:20}: {entry.get(field, 'N/A')}")
+                out(f"{field:20}: {get(field, 'N/A')}")
             
             # Add spacing and Services section
-            print()
-            print(f"{'SERVICES':20}:")
+            out('')
+            out(f"{'SERVICES':20}:")
             for service in self.SERVICES:
-                print(f"  {service:18}: {entry.get(service, 'Unknown')}")
+                out(f"  {service:18}: {get(service, 'Unknown')}")
             
             # Add spacing and Storage Tables section
-            storage_tables = entry.get('STORAGE_TABLES', {})
+            storage_tables = get('STORAGE_TABLES', {})
             if storage_tables:
-                print()
-                print()
-                print("STORAGE USAGE:")
+                out('')
+                out('')
+                out("STORAGE USAGE:")
                 
                 # Storage usage tables
-                usage_tables = ['Active Tier Usage', 'Cloud Tier Usage', 'Total Usage']
-                for table_name in usage_tables:
-                    if table_name in storage_tables:
-                        print()
-                        print(f"{table_name.replace(' Usage', '')}:")
-                        rows = storage_tables[table_name]
-                        
-                        if rows:
-                            # Define clean column names and order for usage tables
-                            columns = ['Resource', 'Size_GiB', 'Used_GiB', 'Avail_GiB', 'Use_Percent', 'Cleanable_GiB']
-                            clean_headers = ['Resource', 'Size GiB', 'Used GiB', 'Avail GiB', 'Use%', 'Cleanable GiB']
-                            
-                            # Print header
-                            header_line = "  " + "  ".join(f"{header:>15}" for header in clean_headers)
-                            print(header_line)
-                            
-                            # Print rows
-                            for row in rows:
-                                values = []
-                                for col in columns:
-                                    value = row.get(col, 'N/A')
-                                    # Convert '-' to 'N/A' and handle empty values
-                                    if value == '-' or value == '':
-                                        value = 'N/A'
-                                    values.append(value)
-                                
-                                row_line = "  " + "  ".join(f"{str(val):>15}" for val in values)
-                                print(row_line)
+                for table_name in _USAGE_TABLES:
+                    rows = storage_tables.get(table_name)
+                    if rows is None:
+                        continue
+                    
+                    out('')
+                    out(f"{table_name.replace(' Usage', '')}:")
+                    
+                    if rows:
+                        # Print header
+                        out(_CONSOLE_USAGE_HEADER)
                         
-                        # Print note if available
-                        note_key = f'{table_name}_note'
-                        if note_key in storage_tables:
-                            print(f"  {storage_tables[note_key]}")
+                        # Print rows, converting '-' and empty values to 'N/A'
+                        for row in rows:
+                            out(_CONSOLE_USAGE_ROW.format(*_console_cells(row, _USAGE_COLUMNS)))
+                    
+                    # Print note if available
+                    note = storage_tables.get(f'{table_name}_note')
+                    if note is not None:
+                        out(f"  {note}")
                 
                 # Compression statistics tables
-                compression_tables = ['Active Tier Compression', 'Cloud Tier Compression', 'Currently Used Summary']
-                for table_name in compression_tables:
-                    if table_name in storage_tables:
-                        print()
-                        print()
-                        print(f"{table_name.replace(' Compression', ' Compression Stats').replace(' Summary', ' Summary')}:")
-                        rows = storage_tables[table_name]
+                for table_name in _COMPRESSION_TABLES:
+                    rows = storage_tables.get(table_name)
+                    if rows is None:
+                        continue
+                    
+                    out('')
+                    out('')
+                    out(f"{table_name.replace(' Compression', ' Compression Stats').replace(' Summary', ' Summary')}:")
+                    
+                    if rows:
+                        # Print header
+                        out(_CONSOLE_COMPRESSION_HEADER)
                         
-                        if rows:
-                            # Define clean column names and order for compression tables
-                            comp_columns = ['Metric', 'Pre_Comp_GiB', 'Post_Comp_GiB', 'Global_Comp_Factor', 'Local_Comp_Factor', 'Total_Comp_Factor']
-                            comp_headers = ['Metric', 'Pre-Comp GiB', 'Post-Comp GiB', 'Global-Comp', 'Local-Comp', 'Total-Comp']
+                        # Print rows, converting '-' and empty values to 'N/A'
+                        for row in rows:
+                            out(_CONSOLE_COMPRESSION_ROW.format(*_console_cells(row, _COMPRESSION_COLUMNS)))
+                    
+                    # Print note if available
+                    note = storage_tables.get(f'{table_name}_note')
+                    if note is not None:
+                        out(f"  {note}")
+                
+                # Mtree compression statistics tables
+                for table_name in _MTREE_TABLES:
+                    rows = storage_tables.get(table_name)
+                    if rows is None:
+                        continue
+                    
+                    out('')
+                    out('')
+                    out(f"{table_name}:")
+                    
+                    if rows:
+                        # Handle different mtree table types
+                        if table_name == 'Mtree List':
+                            # Mtree List has different columns with retention lock and replication info
                             
                             # Print header
-                            header_line = "  " + "  ".join(f"{header:>15}" for header in comp_headers)
-                            print(header_line)
+                            out(_CONSOLE_MTREE_LIST_HEADER)
                             
                             # Print rows
-                            for row in rows:
-                                values = []
-                                for col in comp_columns:
-                                    value = row.get(col, 'N/A')
-                                    # Convert '-' to 'N/A' and handle empty values
-                                    if value == '-' or value == '':
-                                        value = 'N/A'
-                                    values.append(value)
+                            for row in islice(rows, 20):  # Show more for list since it's simpler
+                                # Fetch all cells in one pass, in column order
+                                (name, size, status, ret_lock, lock_mode, min_period, max_period,
+                                 repl_mode, repl_host, repl_enabled) = map(row.get, _MTREE_LIST_COLUMNS, repeat('N/A'))
                                 
-                                row_line = "  " + "  ".join(f"{str(val):>15}" for val in values)
-                                print(row_line)
-                        
-                        # Print note if available
-                        note_key = f'{table_name}_note'
-                        if note_key in storage_tables:
-                            print(f"  {storage_tables[note_key]}")
-                
-                # Mtree compression statistics tables
-                mtree_tables = ['Mtree List', 'Mtree Active Tier Compression', 'Mtree Cloud Tier Compression']
-                for table_name in mtree_tables:
-                    if table_name in storage_tables:
-                        print()
-                        print()
-                        print(f"{table_name}:")
-                        rows = storage_tables[table_name]
-                        
-                        if rows:
-                            # Handle different mtree table types
-                            if table_name == 'Mtree List':
-                                # Mtree List has different columns with retention lock and replication info
-                                list_columns = ['Name', 'Pre_Comp_GiB', 'Status', 'Retention_Lock', 'Lock_Mode', 'Min_Retention_Period', 'Max_Retention_Period', 'Replication_Mode', 'Replication_Host', 'Replication_Enabled']
-                                list_headers = ['Mtree Name', 'Pre-Comp GiB', 'Status', 'Ret Lock', 'Lock Mode', 'Min Period', 'Max Period', 'Repl Mode', 'Repl Host', 'Enabled']
+                                # Truncate long values to fit columns
+                                status = status[:17]
+                                lock_mode = lock_mode[:9]
+                                min_period = min_period[:9]
+                                max_period = max_period[:9]
+                                repl_mode = repl_mode[:10]
+                                repl_host = repl_host[:11]
+                                repl_enabled = repl_enabled[:6]
                                 
-                                # Print header
-                                header_line = f"  {list_headers[0]:<30} {list_headers[1]:>12} {list_headers[2]:<18} {list_headers[3]:<9} {list_headers[4]:<10} {list_headers[5]:<10} {list_headers[6]:<10} {list_headers[7]:<11} {list_headers[8]:<12} {list_headers[9]:<7}"
-                                print(header_line)
-                                
-                                # Print rows
-                                for i, row in enumerate(rows[:20]):  # Show more for list since it's simpler
-                                    name = row.get('Name', 'N/A')
-                                    size = row.get('Pre_Comp_GiB', 'N/A')
-                                    status = row.get('Status', 'N/A')
-                                    ret_lock = row.get('Retention_Lock', 'N/A')
-                                    lock_mode = row.get('Lock_Mode', 'N/A')
-                                    min_period = row.get('Min_Retention_Period', 'N/A')
-                                    max_period = row.get('Max_Retention_Period', 'N/A')
-                                    repl_mode = row.get('Replication_Mode', 'N/A')
-                                    repl_host = row.get('Replication_Host', 'N/A')
-                                    repl_enabled = row.get('Replication_Enabled', 'N/A')
-                                    
-                                    # Truncate long values to fit columns
-                                    status = status[:17] if len(status) > 17 else status
-                                    lock_mode = lock_mode[:9] if len(lock_mode) > 9 else lock_mode
-                                    min_period = min_period[:9] if len(min_period) > 9 else min_period
-                                    max_period = max_period[:9] if len(max_period) > 9 else max_period
-                                    repl_mode = repl_mode[:10] if len(repl_mode) > 10 else repl_mode
-                                    repl_host = repl_host[:11] if len(repl_host) > 11 else repl_host
-                                    repl_enabled = repl_enabled[:6] if len(repl_enabled) > 6 else repl_enabled
-                                    
-                                    row_line = f"  {name:<30} {size:>12} {status:<18} {ret_lock:<9} {lock_mode:<10} {min_period:<10} {max_period:<10} {repl_mode:<11} {repl_host:<12} {repl_enabled:<7}"
-                                    print(row_line)
-                                
-                                if len(rows) > 20:
-                                    print(f"  ... and {len(rows) - 20} more mtrees")
+                                out(_CONSOLE_MTREE_LIST_ROW.format(name, size, status, ret_lock, lock_mode, min_period, max_period,
+                                                                   repl_mode, repl_host, repl_enabled))
                             
-                            else:
-                                # Define clean column names and order for mtree compression tables with separated reduction percentages
-                                mtree_columns = ['Mtree', 'Pre_24hrs_GiB', 'Post_24hrs_GiB', 'Global_24hrs', 'Local_24hrs', 'Total_24hrs', 'Reduction_24hrs_Percent',
-                                               'Pre_7days_GiB', 'Post_7days_GiB', 'Global_7days', 'Local_7days', 'Total_7days', 'Reduction_7days_Percent']
-                                mtree_headers = ['Mtree', 'Pre-24h GiB', 'Post-24h GiB', 'Glob-24h', 'Loc-24h', 'Tot-24h', 'Red-24h%',
-                                               'Pre-7d GiB', 'Post-7d GiB', 'Glob-7d', 'Loc-7d', 'Tot-7d', 'Red-7d%']
-                                
-                                # Print header
-                                header_line = "  " + "  ".join(f"{header:>12}" for header in mtree_headers)
-                                print(header_line)
-                                
-                                # Print rows (limit to first 10 to avoid excessive output)
-                                for i, row in enumerate(rows[:10]):
-                                    values = []
-                                    for col in mtree_columns:
-                                        value = row.get(col, 'N/A')
-                                        # Convert '-' to 'N/A' and handle empty values
-                                        if value == '-' or value == '':
-                                            value = 'N/A'
-                                        # Truncate long mtree names
-                                        if col == 'Mtree' and len(str(value)) > 12:
-                                            value = str(value)[:12]
-                                        values.append(value)
-                                    
-                                    row_line = "  " + "  ".join(f"{str(val):>12}" for val in values)
-                                    print(row_line)
-                                
-                                if len(rows) > 10:
-                                    print(f"  ... and {len(rows) - 10} more mtrees")
+                            if len(rows) > 20:
+                                out(f"  ... and {len(rows) - 20} more mtrees")
                         
-                        # Print note if available
-                        note_key = f'{table_name}_note'
-                        if note_key in storage_tables:
-                            print(f"  {storage_tables[note_key]}")
+                        else:
+                            # Print header
+                            out(_CONSOLE_MTREE_COMPRESSION_HEADER)
+                            
+                            # Print rows (limit to first 10 to avoid excessive output),
+                            # converting '-' and empty values to 'N/A'
+                            for row in islice(rows, 10):
+                                values = _console_cells(row, _MTREE_COMPRESSION_COLUMNS)
+                                # Truncate long mtree names
+                                values[0] = values[0][:12]
+                                out(_CONSOLE_MTREE_COMPRESSION_ROW.format(*values))
+                            
+                            if len(rows) > 10:
+                                out(f"  ... and {len(rows) - 10} more mtrees")
+                    
+                    # Print note if available
+                    note = storage_tables.get(f'{table_name}_note')
+                    if note is not None:
+                        out(f"  {note}")
             
             # Cloud Tier section (only if Cloud Tier is enabled)
-            if entry.get('CLOUD_TIER') == 'Enabled':
-                cloud_profiles = entry.get('CLOUD_PROFILES', [])
-                cloud_movement = entry.get('CLOUD_DATA_MOVEMENT', [])
+            if get('CLOUD_TIER') == 'Enabled':
+                cloud_profiles = get('CLOUD_PROFILES', [])
+                cloud_movement = get('CLOUD_DATA_MOVEMENT', [])
                 
                 if cloud_profiles or cloud_movement:
-                    print()
-                    print()
-                    print("CLOUD TIER:")
-                    print()
+                    out('')
+                    out('')
+                    out("CLOUD TIER:")
+                    out('')
                     
                     # Cloud Profiles
                     if cloud_profiles:
-                        print("Cloud Profiles:")
-                        print(f"  {'Profile Name':<30} {'Provider':<10} {'Endpoint':<35} {'Version':<15} {'Proxy Host':<15} {'Port':<6} {'Username':<10}")
+                        out("Cloud Profiles:")
+                        out(_CONSOLE_CLOUD_PROFILES_HEADER)
                         for profile in cloud_profiles:
                             name = profile.get('Profile_Name', 'N/A')
                             provider = profile.get('Provider', 'N/A')
@@ -1159,32 +1796,35 @@ class AutosupportParser:
                             proxy_username = profile.get('Proxy_Username', 'N/A')
                             
                             # Truncate long values for display
-                            name = name[:29] if len(name) > 29 else name
-                            endpoint = endpoint[:34] if len(endpoint) > 34 else endpoint
-                            version = version[:14] if len(version) > 14 else version
-                            proxy_host = proxy_host[:14] if len(proxy_host) > 14 else proxy_host
-                            proxy_username = proxy_username[:9] if len(proxy_username) > 9 else proxy_username
+                            name = name[:29]
+                            endpoint = endpoint[:34]
+                            version = version[:14]
+                            proxy_host = proxy_host[:14]
+                            proxy_username = proxy_username[:9]
                             
-                            print(f"  {name:<30} {provider:<10} {endpoint:<35} {version:<15} {proxy_host:<15} {proxy_port:<6} {proxy_username:<10}")
-                        print()
+                            out(_CONSOLE_CLOUD_PROFILES_ROW.format(name, provider, endpoint, version, proxy_host, proxy_port, proxy_username))
+                        out('')
                     
                     # Cloud Data-Movement Configuration
                     if cloud_movement:
-                        print("Cloud Data-Movement Configuration:")
-                        print(f"  {'Mtree':<30} {'Target':<26} {'Policy':<15} {'Value':<15}")
+                        out("Cloud Data-Movement Configuration:")
+                        out(_CONSOLE_CLOUD_MOVEMENT_HEADER)
                         for movement in cloud_movement:
                             mtree = movement.get('Mtree', 'N/A')
                             target = movement.get('Target', 'N/A')
                             policy = movement.get('Policy', 'N/A')
                             value = movement.get('Value', 'N/A')
                             # Truncate long values for display
-                            mtree = mtree[:29] if len(mtree) > 29 else mtree
-                            target = target[:25] if len(target) > 25 else target
-                            print(f"  {mtree:<30} {target:<26} {policy:<15} {value:<15}")
+                            mtree = mtree[:29]
+                            target = target[:25]
+                            out(_CONSOLE_CLOUD_MOVEMENT_ROW.format(mtree, target, policy, value))
+            
+            out('')
+            out(f"{'SOURCE_FILE':20}: {get('SOURCE_FILE', 'N/A')}")
+            out(f"{'SOURCE_TAR':20}: {get('SOURCE_TAR', 'N/A')}")
             
-            print()
-            print(f"{'SOURCE_FILE':20}: {entry.get('SOURCE_FILE', 'N/A')}")
-            print(f"{'SOURCE_TAR':20}: {entry.get('SOURCE_TAR', 'N/A')}")
+            print('\n'.join(lines))
+            lines.clear()
     
     def output_to_csv(self, data: List[Dict[str, Any]], output_dir: Optional[str] = None) -> List[str]:
         """
@@ -1224,255 +1864,26 @@ class AutosupportParser:
         os.makedirs(output_dir, exist_ok=True)
         
         # Group data by location first, then by file identifier within each location
-        location_groups = {}
-        for entry in data:
-            location = entry.get('LOCATION', 'unknown')
-            location_folder = self.get_location_folder(location)
-            hostname = entry.get('HOSTNAME', 'unknown')
-            generated_on = entry.get('GENERATED_ON', 'unknown')
-            source_tar = entry.get('SOURCE_TAR', 'unknown')
-            file_identifier = self.get_file_identifier(hostname, generated_on, source_tar)
-            
-            if location_folder not in location_groups:
-                location_groups[location_folder] = {}
-            
-            if file_identifier not in location_groups[location_folder]:
-                location_groups[location_folder][file_identifier] = []
-            
-            location_groups[location_folder][file_identifier].append(entry)
+        location_groups = self._group_by_location(data)
         
-        generated_files = []
+        tasks = []
         
-        # Create location subdirectories and CSV files
+        # Create location subdirectories and collect the CSV files to write
         for location_folder, identifier_groups in location_groups.items():
             # Create location subdirectory
-            location_output_dir = os.path.join(output_dir, location_folder)
-            os.makedirs(location_output_dir, exist_ok=True)
+            location_output_dir = self._make_location_dir(output_dir, location_folder)
             
-            # Create CSV file for each file identifier group within this location
+            # Queue one CSV file for each file identifier group within this location
             for file_identifier, entries in identifier_groups.items():
                 csv_filename = f"{file_identifier}.csv"
                 csv_path = os.path.join(location_output_dir, csv_filename)
-                
-                try:
-                    with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                        writer = csv.writer(csvfile)
-                        
-                        # Write header row
-                        writer.writerow(['Field', 'Value'])
-                        
-                        # For each entry, write fields vertically (one field per row)
-                        for i, entry in enumerate(entries):
-                            if i > 0:  # Add separator between multiple entries
-                                writer.writerow(['---', '---'])
-                            
-                            # Write basic fields
-                            for field in self.REQUIRED_FIELDS:
-                                writer.writerow([field, entry.get(field, 'N/A')])
-                            
-                            # Add spacing and Services section
-                            writer.writerow(['', ''])  # Empty row for spacing
-                            writer.writerow(['SERVICES', ''])
-                            for service in self.SERVICES:
-                                writer.writerow([service, entry.get(service, 'Unknown')])
-                            
-                            # Add spacing and Storage Tables section
-                            storage_tables = entry.get('STORAGE_TABLES', {})
-                            if storage_tables:
-                                writer.writerow(['', ''])  # Empty row for spacing
-                                writer.writerow(['', ''])  # Extra spacing
-                                writer.writerow(['STORAGE USAGE', ''])
-                                
-                                # Storage usage tables
-                                usage_tables = ['Active Tier Usage', 'Cloud Tier Usage', 'Total Usage']
-                                for table_name in usage_tables:
-                                    if table_name in storage_tables:
-                                        writer.writerow(['', ''])  # Empty row for spacing
-                                        writer.writerow([table_name.replace(' Usage', ''), ''])
-                                        
-                                        rows = storage_tables[table_name]
-                                        if rows:
-                                            # Write table header for usage tables
-                                            headers = ['Resource', 'Size GiB', 'Used GiB', 'Avail GiB', 'Use%', 'Cleanable GiB']
-                                            writer.writerow(headers)
-                                            
-                                            # Write table data rows
-                                            for row in rows:
-                                                row_data = [
-                                                    row.get('Resource', 'N/A'),
-                                                    row.get('Size_GiB', 'N/A'),
-                                                    row.get('Used_GiB', 'N/A'), 
-                                                    row.get('Avail_GiB', 'N/A'),
-                                                    row.get('Use_Percent', 'N/A'),
-                                                    row.get('Cleanable_GiB', 'N/A')
-                                                ]
-                                                # Convert '-' to 'N/A'
-                                                row_data = ['N/A' if val == '-' else val for val in row_data]
-                                                writer.writerow(row_data)
-                                        
-                                        # Write note if available
-                                        note_key = f'{table_name}_note'
-                                        if note_key in storage_tables:
-                                            writer.writerow(['Note:', storage_tables[note_key]])
-                                
-                                # Compression statistics tables
-                                compression_tables = ['Active Tier Compression', 'Cloud Tier Compression', 'Currently Used Summary']
-                                for table_name in compression_tables:
-                                    if table_name in storage_tables:
-                                        writer.writerow(['', ''])  # Empty row for spacing
-                                        writer.writerow(['', ''])  # Extra spacing
-                                        writer.writerow([table_name.replace(' Compression', ' Compression Stats').replace(' Summary', ' Summary'), ''])
-                                        
-                                        rows = storage_tables[table_name]
-                                        if rows:
-                                            # Write table header for compression tables
-                                            comp_headers = ['Metric', 'Pre-Comp GiB', 'Post-Comp GiB', 'Global-Comp Factor', 'Local-Comp Factor', 'Total-Comp Factor']
-                                            writer.writerow(comp_headers)
-                                            
-                                            # Write table data rows
-                                            for row in rows:
-                                                row_data = [
-                                                    row.get('Metric', 'N/A'),
-                                                    row.get('Pre_Comp_GiB', 'N/A'),
-                                                    row.get('Post_Comp_GiB', 'N/A'), 
-                                                    row.get('Global_Comp_Factor', 'N/A'),
-                                                    row.get('Local_Comp_Factor', 'N/A'),
-                                                    row.get('Total_Comp_Factor', 'N/A')
-                                                ]
-                                                # Convert '-' to 'N/A'
-                                                row_data = ['N/A' if val == '-' else val for val in row_data]
-                                                writer.writerow(row_data)
-                                        
-                                        # Write note if available
-                                        note_key = f'{table_name}_note'
-                                        if note_key in storage_tables:
-                                            writer.writerow(['Note:', storage_tables[note_key]])
-                                
-                                # Mtree compression statistics tables  
-                                mtree_tables = ['Mtree List', 'Mtree Active Tier Compression', 'Mtree Cloud Tier Compression']
-                                for table_name in mtree_tables:
-                                    if table_name in storage_tables:
-                                        writer.writerow(['', ''])  # Empty row for spacing
-                                        writer.writerow(['', ''])  # Extra spacing
-                                        writer.writerow([table_name, ''])
-                                        
-                                        rows = storage_tables[table_name]
-                                        if rows:
-                                            # Handle different mtree table types
-                                            if table_name == 'Mtree List':
-                                                # Write table header for mtree list with retention lock and replication info
-                                                list_headers = ['Name', 'Pre-Comp GiB', 'Status', 'Retention Lock', 'Lock Mode', 'Min Retention Period', 'Max Retention Period', 'Replication Mode', 'Replication Host', 'Replication Enabled']
-                                                writer.writerow(list_headers)
-                                                
-                                                # Write table data rows
-                                                for row in rows:
-                                                    row_data = [
-                                                        row.get('Name', 'N/A'),
-                                                        row.get('Pre_Comp_GiB', 'N/A'),
-                                                        row.get('Status', 'N/A'),
-                                                        row.get('Retention_Lock', 'N/A'),
-                                                        row.get('Lock_Mode', 'N/A'),
-                                                        row.get('Min_Retention_Period', 'N/A'),
-                                                        row.get('Max_Retention_Period', 'N/A'),
-                                                        row.get('Replication_Mode', 'N/A'),
-                                                        row.get('Replication_Host', 'N/A'),
-                                                        row.get('Replication_Enabled', 'N/A')
-                                                    ]
-                                                    writer.writerow(row_data)
-                                            else:
-                                                # Write table header for mtree compression tables with separated reduction percentages
-                                                mtree_headers = ['Mtree', 'Pre-24hrs GiB', 'Post-24hrs GiB', 'Global-24hrs', 'Local-24hrs', 'Total-24hrs', 'Reduction-24hrs %',
-                                                               'Pre-7days GiB', 'Post-7days GiB', 'Global-7days', 'Local-7days', 'Total-7days', 'Reduction-7days %']
-                                                writer.writerow(mtree_headers)
-                                                
-                                                # Write table data rows
-                                                for row in rows:
-                                                    row_data = [
-                                                        row.get('Mtree', 'N/A'),
-                                                        row.get('Pre_24hrs_GiB', 'N/A'),
-                                                        row.get('Post_24hrs_GiB', 'N/A'),
-                                                        row.get('Global_24hrs', 'N/A'),
-                                                        row.get('Local_24hrs', 'N/A'),
-                                                        row.get('Total_24hrs', 'N/A'),
-                                                        row.get('Reduction_24hrs_Percent', 'N/A'),
-                                                        row.get('Pre_7days_GiB', 'N/A'),
-                                                        row.get('Post_7days_GiB', 'N/A'),
-                                                        row.get('Global_7days', 'N/A'),
-                                                        row.get('Local_7days', 'N/A'),
-                                                        row.get('Total_7days', 'N/A'),
-                                                        row.get('Reduction_7days_Percent', 'N/A')
-                                                    ]
-                                                    # Convert '-' to 'N/A'
-                                                    row_data = ['N/A' if val == '-' else val for val in row_data]
-                                                    writer.writerow(row_data)
-                                        
-                                        # Write note if available
-                                        note_key = f'{table_name}_note'
-                                        if note_key in storage_tables:
-                                            writer.writerow(['Note:', storage_tables[note_key]])
-                            
-                            # Cloud Tier section (only if Cloud Tier is enabled)
-                            if entry.get('CLOUD_TIER') == 'Enabled':
-                                cloud_profiles = entry.get('CLOUD_PROFILES', [])
-                                cloud_movement = entry.get('CLOUD_DATA_MOVEMENT', [])
-                                
-                                if cloud_profiles or cloud_movement:
-                                    writer.writerow(['', ''])  # Empty row for spacing
-                                    writer.writerow(['CLOUD TIER', ''])
-                                    writer.writerow(['', ''])  # Empty row for spacing
-                                    
-                                    # Cloud Profiles
-                                    if cloud_profiles:
-                                        writer.writerow(['Cloud Profiles', ''])
-                                        writer.writerow(['Profile Name', 'Provider', 'Endpoint', 'Version', 'Proxy Host', 'Proxy Port', 'Proxy Username'])
-                                        for profile in cloud_profiles:
-                                            writer.writerow([
-                                                profile.get('Profile_Name', 'N/A'),
-                                                profile.get('Provider', 'N/A'),
-                                                profile.get('Endpoint', 'N/A'),
-                                                profile.get('Version', 'N/A'),
-                                                profile.get('Proxy_Host', 'N/A'),
-                                                profile.get('Proxy_Port', 'N/A'),
-                                                profile.get('Proxy_Username', 'N/A')
-                                            ])
-                                        writer.writerow(['', ''])  # Empty row for spacing
-                                    
-                                    # Cloud Data-Movement Configuration
-                                    if cloud_movement:
-                                        writer.writerow(['Cloud Data-Movement Configuration', ''])
-                                        writer.writerow(['Mtree', 'Target', 'Policy', 'Value'])
-                                        for movement in cloud_movement:
-                                            writer.writerow([
-                                                movement.get('Mtree', 'N/A'),
-                                                movement.get('Target', 'N/A'),
-                                                movement.get('Policy', 'N/A'),
-                                                movement.get('Value', 'N/A')
-                                            ])
-                            
-                            # Add spacing and source info
-                            writer.writerow(['', ''])  # Empty row for spacing
-                            writer.writerow(['SOURCE_FILE', entry.get('SOURCE_FILE', 'N/A')])
-                            writer.writerow(['SOURCE_TAR', entry.get('SOURCE_TAR', 'N/A')])
-                    
-                    generated_files.append(csv_path)
-                    print(f"Generated CSV: {csv_path} ({len(entries)} entries)")
-                    
-                except Exception as e:
-                    print(f"Error creating CSV {csv_path}: {e}")
+                tasks.append((location_folder, csv_filename, csv_path, entries))
+        
+        generated_files, location_summary = self._write_output_files(tasks, self._write_csv_file, 'CSV')
         
         # Print location summary
         if generated_files:
             print(f"\nLocation-based organization summary:")
-            location_summary = {}
-            for file_path in generated_files:
-                # Extract location from path structure
-                path_parts = file_path.split(os.sep)
-                if len(path_parts) >= 2:
-                    location = path_parts[-2]  # Second to last part is location folder
-                    if location not in location_summary:
-                        location_summary[location] = []
-                    location_summary[location].append(os.path.basename(file_path))
-            
             for location, files in location_summary.items():
                 print(f"  📁 {location}/ ({len(files)} files)")
                 for file in files:
@@ -1505,64 +1916,29 @@ class AutosupportParser:
             output_dir = os.getcwd()
         
         # Ensure output directory exists
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Group data by location first, then by file identifier within each location
-        location_groups = {}
-        for entry in data:
-            location = entry.get('LOCATION', 'unknown')
-            location_folder = self.get_location_folder(location)
-            hostname = entry.get('HOSTNAME', 'unknown')
-            generated_on = entry.get('GENERATED_ON', 'unknown')
-            source_tar = entry.get('SOURCE_TAR', 'unknown')
-            file_identifier = self.get_file_identifier(hostname, generated_on, source_tar)
-            
-            if location_folder not in location_groups:
-                location_groups[location_folder] = {}
-            
-            if file_identifier not in location_groups[location_folder]:
-                location_groups[location_folder][file_identifier] = []
-            
-            location_groups[location_folder][file_identifier].append(entry)
+        os.makedirs(output_dir, exist_ok=True)
         
-        generated_files = []
+        # Group data by location first, then by file identifier within each location
+        location_groups = self._group_by_location(data)
+        
+        tasks = []
         
-        # Create location subdirectories and HTML files
+        # Create location subdirectories and collect the HTML files to write
         for location_folder, identifier_groups in location_groups.items():
             # Create location subdirectory
-            location_output_dir = os.path.join(output_dir, location_folder)
-            os.makedirs(location_output_dir, exist_ok=True)
+            location_output_dir = self._make_location_dir(output_dir, location_folder)
             
-            # Create HTML file for each file identifier group within this location
+            # Queue one HTML file for each file identifier group within this location
             for file_identifier, entries in identifier_groups.items():
                 html_filename = f"{file_identifier}.html"
                 html_path = os.path.join(location_output_dir, html_filename)
-                
-                try:
-                    with open(html_path, 'w', encoding='utf-8') as htmlfile:
-                        # Write HTML content (use first entry's hostname for title)
-                        hostname_prefix = self.get_hostname_prefix(entries[0].get('HOSTNAME', 'unknown'))
-                        htmlfile.write(self._generate_html_content(entries, hostname_prefix))
-                    
-                    generated_files.append(html_path)
-                    print(f"Generated HTML: {html_path} ({len(entries)} entries)")
-                    
-                except Exception as e:
-                    print(f"Error creating HTML {html_path}: {e}")
+                tasks.append((location_folder, html_filename, html_path, entries))
+        
+        generated_files, location_summary = self._write_output_files(tasks, self._write_html_file, 'HTML')
         
         # Print location summary
         if generated_files:
             print(f"\nLocation-based organization summary:")
-            location_summary = {}
-            for file_path in generated_files:
-                # Extract location from path structure
-                path_parts = file_path.split(os.sep)
-                if len(path_parts) >= 2:
-                    location = path_parts[-2]  # Second to last part is location folder
-                    if location not in location_summary:
-                        location_summary[location] = []
-                    location_summary[location].append(os.path.basename(file_path))
-            
             for location, files in location_summary.items():
                 print(f"  📁 {location}/ ({len(files)} files)")
                 for file in files:
@@ -1570,6 +1946,221 @@ class AutosupportParser:
         
         return generated_files
     
+    @staticmethod
+    def _make_location_dir(output_dir: str, location_folder: str) -> str:
+        """
+        Create a location subdirectory directly under an existing output directory
+        
+        The output directory is created once up front, so a single mkdir is enough
+        here instead of os.makedirs() walking and checking every parent again.
+        
+        Args:
+            output_dir: Existing output directory
+            location_folder: Sanitized location folder name (a single path component)
+            
+        Returns:
+            Path of the location subdirectory
+        """
+        location_output_dir = os.path.join(output_dir, location_folder)
+        try:
+            os.mkdir(location_output_dir)
+        except FileExistsError:
+            pass
+        return location_output_dir
+    
+    def _write_output_files(self, tasks: List[Tuple[str, str, str, List[Dict[str, Any]]]], write_file,
+                            kind: str) -> Tuple[List[str], Dict[str, List[str]]]:
+        """
+        Write independent output files concurrently on a thread pool
+        
+        Progress and errors are reported from this thread in task order, so the
+        output reads the same as writing the files one after another.
+        
+        Args:
+            tasks: List of (location folder, file name, output path, entries), one per file
+            write_file: Callable taking (output path, entries) that writes one file
+            kind: File type used in progress messages (e.g. 'CSV')
+            
+        Returns:
+            Tuple of (successfully written file paths, file names written per location folder)
+        """
+        generated_files = []
+        location_summary = {}
+        if not tasks:
+            return generated_files, location_summary
+        
+        workers = min(32, (os.cpu_count() or 1) * 4, len(tasks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(write_file, path, entries) for _, _, path, entries in tasks]
+            for (location_folder, filename, path, entries), future in zip(tasks, futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Error creating {kind} {path}: {e}")
+                    continue
+                generated_files.append(path)
+                location_summary.setdefault(location_folder, []).append(filename)
+                print(f"Generated {kind}: {path} ({len(entries)} entries)")
+        
+        return generated_files, location_summary
+    
+    def _write_csv_file(self, csv_path: str, entries: List[Dict[str, Any]]) -> None:
+        """
+        Write one CSV file holding the given autosupport entries
+        
+        Args:
+            csv_path: Path of the CSV file to create
+            entries: Parsed data dictionaries to write, in order
+        """
+        # Format the whole file in memory, then write it with a single call
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        write = buffer.write
+        
+        # Write header row
+        writer.writerow(['Field', 'Value'])
+        
+        # For each entry, write fields vertically (one field per row)
+        for i, entry in enumerate(entries):
+            get = entry.get
+            if i > 0:  # Add separator between multiple entries
+                write(_CSV_SEPARATOR_ROW)
+            
+            # Write basic fields
+            writer.writerows([field, get(field, 'N/A')] for field in self.REQUIRED_FIELDS)
+            
+            # Add spacing and Services section
+            write(_CSV_BLANK_ROW)  # Empty row for spacing
+            writer.writerow(['SERVICES', ''])
+            writer.writerows([service, get(service, 'Unknown')] for service in self.SERVICES)
+            
+            # Add spacing and Storage Tables section
+            storage_tables = get('STORAGE_TABLES', {})
+            if storage_tables:
+                write(_CSV_BLANK_ROW)  # Empty row for spacing
+                write(_CSV_BLANK_ROW)  # Extra spacing
+                writer.writerow(['STORAGE USAGE', ''])
+                
+                # Storage usage tables
+                for table_name in _USAGE_TABLES:
+                    rows = storage_tables.get(table_name)
+                    if rows is None:
+                        continue
+                    
+                    write(_CSV_BLANK_ROW)  # Empty row for spacing
+                    writer.writerow([table_name.replace(' Usage', ''), ''])
+                    
+                    if rows:
+                        # Write table header for usage tables
+                        writer.writerow(_CSV_USAGE_HEADERS)
+                        
+                        # Write table data rows, converting '-' to 'N/A'
+                        writer.writerows(_csv_table_rows(rows, _USAGE_COLUMNS))
+                    
+                    # Write note if available
+                    note = storage_tables.get(f'{table_name}_note')
+                    if note is not None:
+                        writer.writerow(['Note:', note])
+                
+                # Compression statistics tables
+                for table_name in _COMPRESSION_TABLES:
+                    rows = storage_tables.get(table_name)
+                    if rows is None:
+                        continue
+                    
+                    write(_CSV_BLANK_ROW)  # Empty row for spacing
+                    write(_CSV_BLANK_ROW)  # Extra spacing
+                    writer.writerow([table_name.replace(' Compression', ' Compression Stats').replace(' Summary', ' Summary'), ''])
+                    
+                    if rows:
+                        # Write table header for compression tables
+                        writer.writerow(_CSV_COMPRESSION_HEADERS)
+                        
+                        # Write table data rows, converting '-' to 'N/A'
+                        writer.writerows(_csv_table_rows(rows, _COMPRESSION_COLUMNS))
+                    
+                    # Write note if available
+                    note = storage_tables.get(f'{table_name}_note')
+                    if note is not None:
+                        writer.writerow(['Note:', note])
+                
+                # Mtree compression statistics tables  
+                for table_name in _MTREE_TABLES:
+                    rows = storage_tables.get(table_name)
+                    if rows is None:
+                        continue
+                    
+                    write(_CSV_BLANK_ROW)  # Empty row for spacing
+                    write(_CSV_BLANK_ROW)  # Extra spacing
+                    writer.writerow([table_name, ''])
+                    
+                    if rows:
+                        # Handle different mtree table types
+                        if table_name == 'Mtree List':
+                            # Write table header for mtree list with retention lock and replication info
+                            writer.writerow(_CSV_MTREE_LIST_HEADERS)
+                            
+                            # Write table data rows
+                            writer.writerows([row.get(col, 'N/A') for col in _MTREE_LIST_COLUMNS] for row in rows)
+                        else:
+                            # Write table header for mtree compression tables with separated reduction percentages
+                            writer.writerow(_CSV_MTREE_COMPRESSION_HEADERS)
+                            
+                            # Write table data rows, converting '-' to 'N/A'
+                            writer.writerows(_csv_table_rows(rows, _MTREE_COMPRESSION_COLUMNS))
+                    
+                    # Write note if available
+                    note = storage_tables.get(f'{table_name}_note')
+                    if note is not None:
+                        writer.writerow(['Note:', note])
+            
+            # Cloud Tier section (only if Cloud Tier is enabled)
+            if get('CLOUD_TIER') == 'Enabled':
+                cloud_profiles = get('CLOUD_PROFILES', [])
+                cloud_movement = get('CLOUD_DATA_MOVEMENT', [])
+                
+                if cloud_profiles or cloud_movement:
+                    write(_CSV_BLANK_ROW)  # Empty row for spacing
+                    writer.writerow(['CLOUD TIER', ''])
+                    write(_CSV_BLANK_ROW)  # Empty row for spacing
+                    
+                    # Cloud Profiles
+                    if cloud_profiles:
+                        writer.writerow(['Cloud Profiles', ''])
+                        writer.writerow(_CSV_CLOUD_PROFILE_HEADERS)
+                        writer.writerows([profile.get(col, 'N/A') for col in _CLOUD_PROFILE_COLUMNS]
+                                         for profile in cloud_profiles)
+                        write(_CSV_BLANK_ROW)  # Empty row for spacing
+                    
+                    # Cloud Data-Movement Configuration
+                    if cloud_movement:
+                        writer.writerow(['Cloud Data-Movement Configuration', ''])
+                        writer.writerow(_CSV_CLOUD_MOVEMENT_HEADERS)
+                        writer.writerows([movement.get(col, 'N/A') for col in _CLOUD_MOVEMENT_COLUMNS]
+                                         for movement in cloud_movement)
+            
+            # Add spacing and source info
+            write(_CSV_BLANK_ROW)  # Empty row for spacing
+            writer.writerow(['SOURCE_FILE', get('SOURCE_FILE', 'N/A')])
+            writer.writerow(['SOURCE_TAR', get('SOURCE_TAR', 'N/A')])
+        
+        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+            csvfile.write(buffer.getvalue())
+
+    def _write_html_file(self, html_path: str, entries: List[Dict[str, Any]]) -> None:
+        """
+        Write one HTML report holding the given autosupport entries
+        
+        Args:
+            html_path: Path of the HTML file to create
+            entries: Parsed data dictionaries to write, in order
+        """
+        # Use first entry's hostname for title
+        hostname_prefix = self.get_hostname_prefix(entries[0].get('HOSTNAME', 'unknown'))
+        content = self._generate_html_content(entries, hostname_prefix)
+        with open(html_path, 'w', encoding='utf-8') as htmlfile:
+            htmlfile.write(content)
+    
     def _generate_html_content(self, entries: List[Dict[str, Any]], hostname_prefix: str) -> str:
         """
         Generate HTML content for autosupport entries
@@ -1581,373 +2172,77 @@ class AutosupportParser:
         Returns:
             Complete HTML content as string
         """
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{hostname_prefix} - Data Domain Autosupport Report</title>
-    <style>
-        /* Cohesity official green palette */
-        :root {{
-            --brand-green: #00DD68; /* official Cohesity green */
-            --brand-green-dark: #00b355;
-            --surface: #ffffff;
-            --muted: #e6eef0;
-            --text: #0f172a;
-            --subtle: #475569;
-        }}
-        body {{
-            font-family: 'Inter', 'Roboto', 'Helvetica Neue', Arial, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #f7faf8 0%, #eef6f1 100%);
-            color: var(--text);
-            line-height: 1.6;
-        }}
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background-color: var(--surface);
-            padding: 40px;
-            border-radius: 12px;
-            box-shadow: 0 4px 25px rgba(0,0,0,0.06);
-            border: 1px solid var(--muted);
-        }}
-        h1 {{
-            color: var(--text);
-            text-align: center;
-            font-size: 2.25rem;
-            font-weight: 700;
-            margin-bottom: 40px;
-            position: relative;
-            padding-bottom: 20px;
-        }}
-        /* make the first letter of the host name the green accent to mimic the brand mark */
-        h1 .host::first-letter {{
-            color: var(--brand-green);
-            font-weight: 800;
-        }}
-        h1::after {{
-            content: '';
-            position: absolute;
-            bottom: 0;
-            left: 50%;
-            transform: translateX(-50%);
-            width: 80px;
-            height: 4px;
-            background: linear-gradient(90deg, var(--brand-green) 0%, var(--brand-green-dark) 100%);
-            border-radius: 2px;
-        }}
-        h2 {{
-            color: var(--text);
-            font-size: 1.5rem;
-            font-weight: 600;
-            margin-top: 40px;
-            margin-bottom: 20px;
-            padding: 12px 20px;
-            background: linear-gradient(90deg, #f6fbf8 0%, #eef6f1 100%);
-            border-left: 5px solid var(--brand-green);
-            border-radius: 0 8px 8px 0;
-        }}
-        h3 {{
-            color: #334155;
-            font-size: 1.25rem;
-            font-weight: 600;
-            margin-top: 30px;
-            margin-bottom: 15px;
-            padding-bottom: 8px;
-            border-bottom: 2px solid #eef6f1;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-bottom: 25px;
-            background-color: var(--surface);
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.04);
-            border: 1px solid var(--muted);
-        }}
-        th {{
-            background: var(--brand-green);
-            color: #ffffff;
-            padding: 16px 12px;
-            text-align: center;
-            font-weight: 600;
-            font-size: 0.875rem;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            border: none;
-        }}
-        td.label {{
-            background-color: #fbfdfb;
-            font-weight: 600;
-            text-align: left;
-            padding: 14px 16px;
-            border: 1px solid var(--muted);
-            color: var(--subtle);
-            width: 220px;
-        }}
-        td.value {{
-            text-align: right;
-            padding: 14px 16px;
-            border: 1px solid var(--muted);
-            color: var(--text);
-            font-weight: 500;
-        }}
-        tr:nth-child(even) {{
-            background-color: #f6fbf8;
-        }}
-        tr:hover {{
-            background-color: #e8f9ee;
-            transform: translateY(-1px);
-            transition: all 0.2s ease;
-        }}
-        .entry-separator {{
-            margin: 50px 0;
-            border-top: 3px solid var(--brand-green);
-            padding-top: 30px;
-            position: relative;
-        }}
-        .entry-separator::before {{
-            content: '';
-            position: absolute;
-            top: -2px;
-            left: 0;
-            right: 0;
-            height: 1px;
-            background: linear-gradient(90deg, transparent 0%, var(--brand-green) 50%, transparent 100%);
-        }}
-        .note {{
-            background: linear-gradient(135deg, #f0fff4 0%, #dcffe8 100%);
-            border: 1px solid #7dd48b;
-            border-radius: 8px;
-            padding: 16px 20px;
-            margin: 20px 0;
-            font-style: italic;
-            color: #04512b;
-            position: relative;
-            box-shadow: 0 2px 8px rgba(34,197,94,0.06);
-        }}
-        .note::before {{
-            content: '💡';
-            position: absolute;
-            left: -8px;
-            top: 50%;
-            transform: translateY(-50%);
-            background: var(--brand-green);
-            width: 24px;
-            height: 24px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 12px;
-        }}
-        .section-header {{
-            background: linear-gradient(135deg, #0f172a 0%, #071017 100%);
-            color: #ffffff;
-            text-align: center;
-            padding: 16px;
-            font-weight: 700;
-            font-size: 1.1rem;
-            letter-spacing: 1px;
-            text-transform: uppercase;
-            margin-top: 20px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1><span class="host">{hostname_prefix}</span> <span class="separator">—</span> <span class="title-text">Data Domain Autosupport Report</span></h1>
-"""
+        # Collect the report in a list and join it once at the end, rather than
+        # growing a single string with += for every fragment
+        parts = [_HTML_HEAD_TEMPLATE.format(hostname_prefix=escape(hostname_prefix), style=_HTML_STYLE)]
+        append = parts.append
         
         # Process each entry
         for i, entry in enumerate(entries):
+            get = entry.get
             if i > 0:
-                html_content += '<div class="entry-separator"></div>'
+                append('<div class="entry-separator"></div>')
             
             # Removed automatic 'Entry N' heading to keep header focused on hostname
             
             # Basic system information
-            html_content += '<h3>System Information</h3>'
-            html_content += '<table>'
-            for field in self.REQUIRED_FIELDS:
-                value = entry.get(field, 'N/A')
-                html_content += f'<tr><td class="label">{field}</td><td class="value">{value}</td></tr>'
-            html_content += '</table>'
+            append(_HTML_SYSTEM_INFO_TABLE % ''.join([_HTML_FIELD_ROW % (field, escape(get(field, 'N/A')))
+                                                      for field in self.REQUIRED_FIELDS]))
             
             # Services status
-            html_content += '<h3>Services Status</h3>'
-            html_content += '<table>'
-            for service in self.SERVICES:
-                status = entry.get(service, 'Unknown')
-                html_content += f'<tr><td class="label">{service}</td><td class="value">{status}</td></tr>'
-            html_content += '</table>'
+            append(_HTML_SERVICES_TABLE % ''.join([_HTML_FIELD_ROW % (service, escape(get(service, 'Unknown')))
+                                                   for service in self.SERVICES]))
             
             # Storage tables
-            storage_tables = entry.get('STORAGE_TABLES', {})
+            storage_tables = get('STORAGE_TABLES', {})
             if storage_tables:
-                html_content += '<div class="section-header">STORAGE USAGE</div>'
-                
-                # Storage usage tables
-                usage_tables = ['Active Tier Usage', 'Cloud Tier Usage', 'Total Usage']
-                for table_name in usage_tables:
-                    if table_name in storage_tables:
-                        html_content += f'<h3>{table_name.replace(" Usage", "")}</h3>'
-                        rows = storage_tables[table_name]
-                        if rows:
-                            html_content += '<table>'
-                            html_content += '<tr><th>Resource</th><th>Size GiB</th><th>Used GiB</th><th>Avail GiB</th><th>Use%</th><th>Cleanable GiB</th></tr>'
-                            for row in rows:
-                                html_content += '<tr>'
-                                html_content += f'<td class="label">{row.get("Resource", "N/A")}</td>'
-                                html_content += f'<td class="value">{row.get("Size_GiB", "N/A")}</td>'
-                                html_content += f'<td class="value">{row.get("Used_GiB", "N/A")}</td>'
-                                html_content += f'<td class="value">{row.get("Avail_GiB", "N/A")}</td>'
-                                html_content += f'<td class="value">{row.get("Use_Percent", "N/A")}</td>'
-                                html_content += f'<td class="value">{row.get("Cleanable_GiB", "N/A")}</td>'
-                                html_content += '</tr>'
-                            html_content += '</table>'
-                        
-                        # Add note if available
-                        note_key = f'{table_name}_note'
-                        if note_key in storage_tables:
-                            html_content += f'<div class="note">{storage_tables[note_key]}</div>'
-                
-                # Compression statistics tables
-                compression_tables = ['Active Tier Compression', 'Cloud Tier Compression', 'Currently Used Summary']
-                for table_name in compression_tables:
-                    if table_name in storage_tables:
-                        html_content += f'<h3>{table_name.replace(" Compression", " Compression Stats").replace(" Summary", " Summary")}</h3>'
-                        rows = storage_tables[table_name]
-                        if rows:
-                            html_content += '<table>'
-                            html_content += '<tr><th>Metric</th><th>Pre-Comp GiB</th><th>Post-Comp GiB</th><th>Global-Comp Factor</th><th>Local-Comp Factor</th><th>Total-Comp Factor</th></tr>'
-                            for row in rows:
-                                html_content += '<tr>'
-                                html_content += f'<td class="label">{row.get("Metric", "N/A")}</td>'
-                                html_content += f'<td class="value">{row.get("Pre_Comp_GiB", "N/A")}</td>'
-                                html_content += f'<td class="value">{row.get("Post_Comp_GiB", "N/A")}</td>'
-                                html_content += f'<td class="value">{row.get("Global_Comp_Factor", "N/A")}</td>'
-                                html_content += f'<td class="value">{row.get("Local_Comp_Factor", "N/A")}</td>'
-                                html_content += f'<td class="value">{row.get("Total_Comp_Factor", "N/A")}</td>'
-                                html_content += '</tr>'
-                            html_content += '</table>'
-                        
-                        # Add note if available
-                        note_key = f'{table_name}_note'
-                        if note_key in storage_tables:
-                            html_content += f'<div class="note">{storage_tables[note_key]}</div>'
+                append('<div class="section-header">STORAGE USAGE</div>')
                 
-                # Mtree tables
-                mtree_tables = ['Mtree List', 'Mtree Active Tier Compression', 'Mtree Cloud Tier Compression']
-                for table_name in mtree_tables:
-                    if table_name in storage_tables:
-                        html_content += f'<h3>{table_name}</h3>'
-                        rows = storage_tables[table_name]
-                        if rows:
-                            html_content += '<table>'
-                            
-                            if table_name == 'Mtree List':
-                                # Mtree List headers
-                                html_content += '<tr><th>Name</th><th>Pre-Comp GiB</th><th>Status</th><th>Ret Lock</th><th>Lock Mode</th><th>Min Period</th><th>Max Period</th><th>Repl Mode</th><th>Repl Host</th><th>Enabled</th></tr>'
-                                for row in rows:  # Show all rows
-                                    html_content += '<tr>'
-                                    html_content += f'<td class="label">{row.get("Name", "N/A")}</td>'
-                                    html_content += f'<td class="value">{row.get("Pre_Comp_GiB", "N/A")}</td>'
-                                    html_content += f'<td class="value">{row.get("Status", "N/A")}</td>'
-                                    html_content += f'<td class="value">{row.get("Retention_Lock", "N/A")}</td>'
-                                    html_content += f'<td class="value">{row.get("Lock_Mode", "N/A")}</td>'
-                                    html_content += f'<td class="value">{row.get("Min_Retention_Period", "N/A")}</td>'
-                                    html_content += f'<td class="value">{row.get("Max_Retention_Period", "N/A")}</td>'
-                                    html_content += f'<td class="value">{row.get("Replication_Mode", "N/A")}</td>'
-                                    html_content += f'<td class="value">{row.get("Replication_Host", "N/A")}</td>'
-                                    html_content += f'<td class="value">{row.get("Replication_Enabled", "N/A")}</td>'
-                                    html_content += '</tr>'
-                            else:
-                                # Mtree compression headers
-                                html_content += '<tr><th>Mtree</th><th>Pre-24hrs GiB</th><th>Post-24hrs GiB</th><th>Global-24hrs</th><th>Local-24hrs</th><th>Total-24hrs</th><th>Red-24hrs %</th><th>Pre-7days GiB</th><th>Post-7days GiB</th><th>Global-7days</th><th>Local-7days</th><th>Total-7days</th><th>Red-7days %</th></tr>'
-                                for row in rows:  # Show all rows
-                                    html_content += '<tr>'
-                                    html_content += f'<td class="label">{row.get("Mtree", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Pre_24hrs_GiB", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Post_24hrs_GiB", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Global_24hrs", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Local_24hrs", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Total_24hrs", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Reduction_24hrs_Percent", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Pre_7days_GiB", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Post_7days_GiB", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Global_7days", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Local_7days", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Total_7days", "-").replace("N/A", "-")}</td>'
-                                    html_content += f'<td class="value">{row.get("Reduction_7days_Percent", "-").replace("N/A", "-")}</td>'
-                                    html_content += '</tr>'
-                            
-                            html_content += '</table>'
-                        
-                        # Add note if available
-                        note_key = f'{table_name}_note'
-                        if note_key in storage_tables:
-                            html_content += f'<div class="note">{storage_tables[note_key]}</div>'
+                # Usage, compression and Mtree tables, all rendered the same way
+                for table_name, heading, table_head, render_rows, row_template, columns in _HTML_STORAGE_TABLES:
+                    rows = storage_tables.get(table_name)
+                    if rows is None:
+                        continue
+                    
+                    append(heading)
+                    if rows:
+                        append(table_head)
+                        append(render_rows(rows, row_template, columns))  # Show all rows
+                        append('</table>')
+                    
+                    # Add note if available
+                    note = storage_tables.get(f'{table_name}_note')
+                    if note is not None:
+                        append(f'<div class="note">{escape(note)}</div>')
             
             # Cloud Tier section
-            if entry.get('CLOUD_TIER') == 'Enabled':
-                cloud_profiles = entry.get('CLOUD_PROFILES', [])
-                cloud_movement = entry.get('CLOUD_DATA_MOVEMENT', [])
+            if get('CLOUD_TIER') == 'Enabled':
+                cloud_profiles = get('CLOUD_PROFILES', [])
+                cloud_movement = get('CLOUD_DATA_MOVEMENT', [])
                 
                 if cloud_profiles or cloud_movement:
-                    html_content += '<div class="section-header">CLOUD TIER</div>'
+                    append('<div class="section-header">CLOUD TIER</div>')
                     
                     # Cloud Profiles
                     if cloud_profiles:
-                        html_content += '<h3>Cloud Profiles</h3>'
-                        html_content += '<table>'
-                        html_content += '<tr><th>Profile Name</th><th>Provider</th><th>Endpoint</th><th>Version</th><th>Proxy Host</th><th>Proxy Port</th><th>Proxy Username</th></tr>'
-                        for profile in cloud_profiles:
-                            html_content += '<tr>'
-                            html_content += f'<td class="label">{profile.get("Profile_Name", "N/A")}</td>'
-                            html_content += f'<td class="value">{profile.get("Provider", "N/A")}</td>'
-                            html_content += f'<td class="value">{profile.get("Endpoint", "N/A")}</td>'
-                            html_content += f'<td class="value">{profile.get("Version", "N/A")}</td>'
-                            html_content += f'<td class="value">{profile.get("Proxy_Host", "N/A")}</td>'
-                            html_content += f'<td class="value">{profile.get("Proxy_Port", "N/A")}</td>'
-                            html_content += f'<td class="value">{profile.get("Proxy_Username", "N/A")}</td>'
-                            html_content += '</tr>'
-                        html_content += '</table>'
+                        append(_HTML_CLOUD_PROFILES_TABLE % _html_table_rows(cloud_profiles, _HTML_CLOUD_PROFILE_ROW,
+                                                                             _CLOUD_PROFILE_COLUMNS))
                     
                     # Cloud Data-Movement Configuration
                     if cloud_movement:
-                        html_content += '<h3>Cloud Data-Movement Configuration</h3>'
-                        html_content += '<table>'
-                        html_content += '<tr><th>Mtree</th><th>Target</th><th>Policy</th><th>Value</th></tr>'
-                        for movement in cloud_movement:
-                            html_content += '<tr>'
-                            html_content += f'<td class="label">{movement.get("Mtree", "N/A")}</td>'
-                            html_content += f'<td class="value">{movement.get("Target", "N/A")}</td>'
-                            html_content += f'<td class="value">{movement.get("Policy", "N/A")}</td>'
-                            html_content += f'<td class="value">{movement.get("Value", "N/A")}</td>'
-                            html_content += '</tr>'
-                        html_content += '</table>'
+                        append(_HTML_CLOUD_MOVEMENT_TABLE % _html_table_rows(cloud_movement, _HTML_CLOUD_MOVEMENT_ROW,
+                                                                             _CLOUD_MOVEMENT_COLUMNS))
             
             # Source information
-            html_content += '<h3>Source Information</h3>'
-            html_content += '<table>'
-            html_content += f'<tr><td class="label">SOURCE_FILE</td><td class="value">{entry.get("SOURCE_FILE", "N/A")}</td></tr>'
-            html_content += f'<tr><td class="label">SOURCE_TAR</td><td class="value">{entry.get("SOURCE_TAR", "N/A")}</td></tr>'
-            html_content += '</table>'
+            append(_HTML_SOURCE_TABLE % (escape(get('SOURCE_FILE', 'N/A')), escape(get('SOURCE_TAR', 'N/A'))))
         
         # Close HTML
-        html_content += """
-    </div>
-</body>
-</html>"""
+        append(_HTML_TAIL)
         
-        return html_content
+        return ''.join(parts)
     
-    def run(self, input_path: str, output_format: str = 'console', output_dir: Optional[str] = None) -> None:
+    def run(self, input_path: str, output_format: str = 'console', output_dir: Optional[str] = None,
+            jobs: Optional[int] = None) -> None:
         """
         Main execution method
         
@@ -1955,6 +2250,7 @@ class AutosupportParser:
             input_path: Path to tar.gz file or directory containing tar.gz files
             output_format: Output format ('console', 'csv', or 'html')
             output_dir: Directory for file output (if applicable)
+            jobs: Number of worker processes for directory input (default: one per CPU core)
         """
         print(f"Autosupport Parser Starting...")
         print(f"Input: {input_path}")
@@ -1973,7 +2269,7 @@ class AutosupportParser:
                 return
         elif os.path.isdir(input_path):
             # Directory containing tar.gz and/or .eml files
-            self.parsed_data = self.process_directory(input_path)
+            self.parsed_data = self.process_directory(input_path, jobs)
         else:
             print(f"Error: {input_path} is not a valid file or directory")
             return
@@ -1999,6 +2295,32 @@ class AutosupportParser:
                 print(f"\nGenerated {len(generated_files)} HTML files")
 
 
+def _process_input_file(file_path: str, parser_cls: Type[AutosupportParser] = AutosupportParser,
+                        cache_dir: Optional[str] = None) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Process a single tar.gz or .eml file in a worker process
+    
+    Progress messages are captured and returned with the results so the
+    caller can print them in input order.
+    
+    Args:
+        file_path: Path to tar.gz or .eml file
+        parser_cls: Parser class to use, so subclass overrides apply in workers too
+        cache_dir: Directory for cached parse results (default: no caching)
+        
+    Returns:
+        Tuple of (list of parsed data dictionaries, captured progress output)
+    """
+    parser = parser_cls(cache_dir)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        if file_path.endswith('.eml'):
+            results = parser.process_single_eml(file_path)
+        else:
+            results = parser.process_single_tar(file_path)
+    return results, output.getvalue()
+
+
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -2023,6 +2345,17 @@ def main():
         help='Output directory for CSV files. Files are organized in location-based subdirectories (default: current directory)'
     )
     
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        help='Number of worker processes used for directory input (default: one per CPU core)'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        help='Cache parsed results in this directory, keyed by autosupport content, so unchanged files are not re-parsed on later runs (default: no caching)'
+    )
+    
     parser.add_argument(
         '--version', '-v',
         action='version',
@@ -2031,15 +2364,18 @@ def main():
     
     args = parser.parse_args()
     
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    
     # Validate input path
     if not os.path.exists(args.input_path):
         print(f"Error: Input path '{args.input_path}' does not exist")
         return 1
     
     # Create parser and run
-    autosupport_parser = AutosupportParser()
+    autosupport_parser = AutosupportParser(args.cache_dir)
     try:
-        autosupport_parser.run(args.input_path, args.format, args.output)
+        autosupport_parser.run(args.input_path, args.format, args.output, args.jobs)
         return 0
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")